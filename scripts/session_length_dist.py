@@ -3,6 +3,10 @@
 
 This measures what we'd actually index - the cleaned text from adapters,
 not raw JSON.
+
+Usage: session_length_dist.py [--show]
+
+The plot is always saved as PNG; pass --show to also open it in a window.
 """
 
 import sys
@@ -15,6 +19,13 @@ from garde.adapters.claude_code import discover_claude_code
 from garde.adapters.cloud_sessions import discover_cloud_sessions
 from garde.adapters.handoffs import discover_handoffs
 from garde.config import load_config
+import matplotlib
+
+SHOW = '--show' in sys.argv
+if not SHOW:
+    # Saving only - skip loading a GUI toolkit
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -57,39 +68,48 @@ def main():
     print(f"  Found {len(handoff_lengths)} handoffs")
 
     # Combined stats
-    all_lengths = cc_lengths + cloud_lengths + handoff_lengths
+    all_lengths = np.fromiter(
+        (*cc_lengths, *cloud_lengths, *handoff_lengths), dtype=np.int64
+    )
+    median = np.median(all_lengths)
+    total_chars = int(all_lengths.sum())
 
     print(f"\n=== Statistics ===")
     print(f"Total sources: {len(all_lengths)}")
-    print(f"Total chars: {sum(all_lengths):,}")
-    print(f"Mean: {np.mean(all_lengths):,.0f} chars")
-    print(f"Median: {np.median(all_lengths):,.0f} chars")
-    print(f"Std: {np.std(all_lengths):,.0f} chars")
-    print(f"Min: {min(all_lengths):,} chars")
-    print(f"Max: {max(all_lengths):,} chars")
+    print(f"Total chars: {total_chars:,}")
+    print(f"Mean: {all_lengths.mean():,.0f} chars")
+    print(f"Median: {median:,.0f} chars")
+    print(f"Std: {all_lengths.std():,.0f} chars")
+    print(f"Min: {all_lengths.min():,} chars")
+    print(f"Max: {all_lengths.max():,} chars")
     print(f"\nPercentiles:")
-    for p in [50, 75, 90, 95, 99]:
-        print(f"  {p}th: {np.percentile(all_lengths, p):,.0f} chars")
+    percentiles = [50, 75, 90, 95, 99]
+    for p, value in zip(percentiles, np.percentile(all_lengths, percentiles)):
+        print(f"  {p}th: {value:,.0f} chars")
 
     # Estimate storage
-    total_mb = sum(all_lengths) / 1_000_000
+    total_mb = total_chars / 1_000_000
     print(f"\nEstimated FTS storage: {total_mb:.1f} MB")
 
     # Plot
     fig, axes = plt.subplots(2, 2, figsize=(12, 10))
 
+    # One histogram, drawn on both the linear and log axes
+    counts, edges = np.histogram(all_lengths, bins=50)
+    widths = np.diff(edges)
+
     # Histogram - all sources
     ax1 = axes[0, 0]
-    ax1.hist(all_lengths, bins=50, edgecolor='black', alpha=0.7)
+    ax1.bar(edges[:-1], counts, width=widths, align='edge', edgecolor='black', alpha=0.7)
     ax1.set_xlabel('Characters')
     ax1.set_ylabel('Count')
     ax1.set_title(f'All Sources (n={len(all_lengths)})')
-    ax1.axvline(np.median(all_lengths), color='red', linestyle='--', label=f'Median: {np.median(all_lengths):,.0f}')
+    ax1.axvline(median, color='red', linestyle='--', label=f'Median: {median:,.0f}')
     ax1.legend()
 
     # Log scale histogram
     ax2 = axes[0, 1]
-    ax2.hist(all_lengths, bins=50, edgecolor='black', alpha=0.7)
+    ax2.bar(edges[:-1], counts, width=widths, align='edge', edgecolor='black', alpha=0.7)
     ax2.set_xlabel('Characters')
     ax2.set_ylabel('Count (log scale)')
     ax2.set_title('All Sources (log scale)')
@@ -106,8 +126,12 @@ def main():
     # CDF
     ax4 = axes[1, 1]
     sorted_lengths = np.sort(all_lengths)
-    cdf = np.arange(1, len(sorted_lengths) + 1) / len(sorted_lengths)
-    ax4.plot(sorted_lengths, cdf)
+    n = len(sorted_lengths)
+    # ~2000 evenly spaced ranks (always including the last) draw the same
+    # curve as plotting every source
+    idx = np.unique(np.linspace(0, n - 1, min(n, 2000)).astype(np.int64))
+    cdf = (idx + 1) / n
+    ax4.plot(sorted_lengths[idx], cdf, drawstyle='steps-post')
     ax4.set_xlabel('Characters')
     ax4.set_ylabel('Cumulative Proportion')
     ax4.set_title('CDF - What % of sessions are under X chars?')
@@ -123,8 +147,8 @@ def main():
     plt.savefig(output_path, dpi=150)
     print(f"\nPlot saved to: {output_path}")
 
-    # Also show
-    plt.show()
+    if SHOW:
+        plt.show()
 
 
 if __name__ == "__main__":
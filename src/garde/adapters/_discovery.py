@@ -0,0 +1,170 @@
+"""Shared helpers for the discover_* functions.
+
+Discovery is dominated by per-file read + decode work that is independent
+across files, so adapters hand their file lists to parse_parallel() and
+keep reporting (and any ordering-sensitive logic) on the calling thread.
+Every call shares one pool, so running several discovers at once doesn't
+multiply the thread count. Parse failures are reported on stderr, which
+keeps them out of scan's buffered stdout.
+"""
+
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Cap on parses submitted but not yet consumed. Bounds memory when the
+# consumer is slower than the pool (e.g. scan writing to SQLite).
+MAX_IN_FLIGHT = 128
+
+# Marks the end of a prefetch() stream
+_END = object()
+
+# One executor for every parse_parallel call, created on first use
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _shared_pool() -> ThreadPoolExecutor:
+    """Return the executor all parse_parallel calls share.
+
+    scan runs several discover_* walks at once; a single pool caps their
+    combined parse threads instead of each walk starting its own.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(thread_name_prefix='garde-parse')
+        return _pool
+
+
+def parse_parallel(
+    parse: Callable[[T], R],
+    items: Iterable[T],
+    max_in_flight: int = MAX_IN_FLIGHT,
+) -> Iterator[tuple[T, R | None, Exception | None]]:
+    """Apply parse to each item on the shared discovery pool.
+
+    Yields (item, result, error) in input order. Exceptions raised by
+    parse are returned rather than raised, so one bad file doesn't stop
+    discovery and the caller decides how to report it. At most
+    max_in_flight items are queued or held ahead of the consumer.
+    """
+    def _safe(item: T) -> tuple[R | None, Exception | None]:
+        try:
+            return parse(item), None
+        except Exception as e:
+            return None, e
+
+    pool = _shared_pool()
+    pending = deque()
+    for item in items:
+        if len(pending) >= max_in_flight:
+            done_item, future = pending.popleft()
+            yield done_item, *future.result()
+        pending.append((item, pool.submit(_safe, item)))
+    while pending:
+        done_item, future = pending.popleft()
+        yield done_item, *future.result()
+
+
+def glob_one_level(base_path: Path, pattern: str) -> Iterator[Path]:
+    """Equivalent of base_path.glob(pattern), fast for '*/fixed/suffix'.
+
+    Patterns like '*/.bon/items.jsonl' (one wildcard directory level, the
+    rest literal) are resolved with a single os.scandir of base_path and
+    one existence check per subdirectory. Anything else falls back to
+    Path.glob.
+    """
+    head, sep, suffix = pattern.lstrip('/').partition('/')
+    if head != '*' or not sep or any(c in suffix for c in '*?['):
+        yield from base_path.glob(pattern.lstrip('/'))
+        return
+
+    try:
+        with os.scandir(base_path) as it:
+            entries = [entry for entry in it if entry.is_dir()]
+    except OSError:
+        return
+    for entry in entries:
+        candidate = os.path.join(entry.path, suffix)
+        if os.path.exists(candidate):
+            yield Path(candidate)
+
+
+def iter_files(base_path: Path, pattern: str) -> Iterator[tuple[Path, os.stat_result]]:
+    """Yield (path, stat) for regular files under base_path matching pattern.
+
+    Same matches and order as filtering base_path.glob(pattern) with
+    is_file(). Patterns of the form '*.md' and '**/*.md' are walked with
+    os.scandir, reusing each DirEntry's stat instead of building Path
+    objects for every entry; anything else falls back to Path.glob.
+    """
+    recursive = pattern.startswith('**/')
+    name_pattern = pattern[3:] if recursive else pattern
+    suffix = name_pattern[1:]
+    if not name_pattern.startswith('*') or any(c in suffix for c in '*?[/'):
+        for path in base_path.glob(pattern):
+            if path.is_file():
+                yield path, path.stat()
+        return
+
+    # Pre-order walk like pathlib's '**': a directory's files, then its
+    # subdirectories in listing order. Symlinked directories aren't entered.
+    stack = [str(base_path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.name.endswith(suffix) and entry.is_file():
+                try:
+                    yield Path(entry.path), entry.stat()
+                except OSError:
+                    continue
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+        stack.extend(reversed(subdirs))
+
+
+def prefetch(items: Iterable[T], max_buffered: int = MAX_IN_FLIGHT) -> Iterator[T]:
+    """Start consuming items on a background thread; return an iterator over them.
+
+    Lets several discover_* walks run at once while the caller still
+    handles them one adapter at a time. At most max_buffered items wait
+    unconsumed. An exception raised by items is re-raised from the
+    returned iterator after the items produced before it.
+    """
+    buffer = queue.Queue(maxsize=max_buffered)
+
+    def fill():
+        try:
+            for item in items:
+                buffer.put((item, None))
+        except Exception as e:
+            buffer.put((_END, e))
+        else:
+            buffer.put((_END, None))
+
+    # Daemon: a caller that stops early mustn't keep the process alive
+    threading.Thread(target=fill, daemon=True).start()
+
+    def drain() -> Iterator[T]:
+        while True:
+            item, error = buffer.get()
+            if item is _END:
+                if error is not None:
+                    raise error
+                return
+            yield item
+
+    return drain()
@@ -11,13 +11,18 @@ Key features:
 """
 
 from pathlib import Path
+import fnmatch
 import json
+import os
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Iterator
 
+from ._discovery import parse_parallel
 
-@dataclass
+
+@dataclass(slots=True)
 class AmpSource:
     thread_id: str
     title: str
@@ -25,10 +30,11 @@ class AmpSource:
     created_at: datetime
     updated_at: datetime
     messages: list
+    activated_skills: list
+    metadata: dict
     agent_mode: str = "smart"
     project_path: str | None = None
-    activated_skills: list = field(default_factory=list)
-    metadata: dict = field(default_factory=dict)
+    _full_text: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def source_id(self) -> str:
@@ -40,44 +46,48 @@ class AmpSource:
 
     @classmethod
     def from_file(cls, path: Path) -> 'AmpSource':
-        data = json.loads(path.read_text())
+        data = json.loads(path.read_bytes())
 
         thread_id = data['id']
+        messages = data.get('messages', [])
+        agent_mode = data.get('agentMode')
         created_ms = data.get('created', 0)
         created_at = datetime.fromtimestamp(created_ms / 1000, tz=timezone.utc)
 
-        # updated_at: use the last assistant message timestamp, or fall back to created
+        # updated_at: use the last assistant message timestamp, or fall back to created.
+        # Walking backwards stops at the most recent one instead of scanning everything.
         updated_at = created_at
-        for msg in reversed(data.get('messages', [])):
-            if msg.get('role') == 'assistant':
-                usage = msg.get('usage', {})
-                ts = usage.get('timestamp')
-                if ts:
-                    updated_at = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                    break
-
-        # Project path from env.initial.trees
+        for msg in reversed(messages):
+            if msg.get('role') != 'assistant':
+                continue
+            ts = (msg.get('usage') or {}).get('timestamp')
+            if ts:
+                updated_at = datetime.fromisoformat(ts)
+                break
+
+        # Project path from the first tree, display names from all of them
         project_path = None
         trees = data.get('env', {}).get('initial', {}).get('trees', [])
         if trees:
             uri = trees[0].get('uri', '')
             if uri.startswith('file://'):
                 project_path = uri[7:]  # strip file://
+        tree_names = [tree.get('displayName', '') for tree in trees]
 
         # Activated skills
-        skills = [s.get('name', '') for s in data.get('activatedSkills', [])]
+        skills = [s.get('name', '') for s in data.get('activatedSkills', ())]
 
         # Metadata for enrichment
         metadata = {}
-        if data.get('agentMode'):
-            metadata['agent_mode'] = data['agentMode']
+        if agent_mode:
+            metadata['agent_mode'] = agent_mode
         if skills:
             metadata['skills'] = skills
-        if trees:
-            metadata['trees'] = [t.get('displayName', '') for t in trees]
+        if tree_names:
+            metadata['trees'] = tree_names
 
         # Handoff chain links (parent/child relationships between threads)
-        relationships = data.get('relationships', [])
+        relationships = data.get('relationships')
         if relationships:
             metadata['relationships'] = [
                 {
@@ -94,38 +104,43 @@ class AmpSource:
             path=path,
             created_at=created_at,
             updated_at=updated_at,
-            messages=data.get('messages', []),
-            agent_mode=data.get('agentMode', 'smart'),
+            messages=messages,
+            agent_mode=agent_mode or 'smart',
             project_path=project_path,
             activated_skills=skills,
             metadata=metadata,
         )
 
-    def full_text(self) -> str:
-        """Extract human-readable text from the conversation.
-
-        Includes user and assistant text blocks. Skips thinking blocks
-        (internal reasoning), tool_use (JSON payloads), and tool_result
-        (often large/noisy). This matches what a human would read.
-        """
-        parts = []
+    def _iter_text(self) -> Iterator[str]:
+        """Yield one 'Role: text' part per non-empty text block."""
         for msg in self.messages:
             role = msg.get('role', '')
             if role not in ('user', 'assistant'):
                 continue
-
-            for block in msg.get('content', []):
-                if isinstance(block, dict) and block.get('type') == 'text':
-                    text = block.get('text', '').strip()
-                    if text:
-                        prefix = 'Human' if role == 'user' else 'Assistant'
-                        parts.append(f"{prefix}: {text}")
+            prefix = 'Human: ' if role == 'user' else 'Assistant: '
+
+            for block in msg.get('content', ()):
+                if isinstance(block, dict):
+                    if block.get('type') == 'text':
+                        text = block.get('text', '').strip()
+                        if text:
+                            yield prefix + text
                 elif isinstance(block, str):
                     # Some user messages have bare string content
-                    if block.strip():
-                        parts.append(f"Human: {block.strip()}")
+                    text = block.strip()
+                    if text:
+                        yield 'Human: ' + text
+
+    def full_text(self) -> str:
+        """Extract human-readable text from the conversation.
 
-        return '\n\n'.join(parts)
+        Includes user and assistant text blocks. Skips thinking blocks
+        (internal reasoning), tool_use (JSON payloads), and tool_result
+        (often large/noisy). This matches what a human would read.
+        """
+        if self._full_text is None:
+            self._full_text = '\n\n'.join(self._iter_text())
+        return self._full_text
 
 
 def discover_amp(config: dict) -> Iterator[AmpSource]:
@@ -137,11 +152,22 @@ def discover_amp(config: dict) -> Iterator[AmpSource]:
     if not path.exists():
         return
 
-    for file in sorted(path.glob(pattern)):
-        # Skip write-ahead temp files
-        if file.name.endswith('.amptmp'):
-            continue
-        try:
-            yield AmpSource.from_file(file)
-        except Exception as e:
-            print(f"Failed to parse {file.name}: {e}")
+    if '/' in pattern:
+        candidates = sorted(path.glob(pattern))
+    else:
+        # Flat directory: one scandir, matching names without building a Path per entry
+        with os.scandir(path) as it:
+            names = sorted(
+                entry.name for entry in it
+                if fnmatch.fnmatchcase(entry.name, pattern) and entry.is_file()
+            )
+        candidates = [path / name for name in names]
+
+    # Skip write-ahead temp files
+    files = [f for f in candidates if not f.name.endswith('.amptmp')]
+
+    for file, source, error in parse_parallel(AmpSource.from_file, files):
+        if error is not None:
+            print(f"Failed to parse {file.name}: {error}", file=sys.stderr)
+        else:
+            yield source
@@ -12,13 +12,17 @@ Discovery uses glob patterns since bon doesn't have a registry.
 
 from pathlib import Path
 import json
+import os
 import subprocess
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Iterator
 
+from ._discovery import glob_one_level, parse_parallel
 
-@dataclass
+
+@dataclass(slots=True)
 class BonSource:
     """An item (outcome or action) from the bon tracker."""
     path: Path                    # Path to items.jsonl
@@ -45,14 +49,12 @@ class BonSource:
 
     def full_text(self) -> str:
         """Combine all text fields for indexing."""
-        parts = [self.title]
-        if self.brief_why:
-            parts.append(f"Why: {self.brief_why}")
-        if self.brief_what:
-            parts.append(f"What: {self.brief_what}")
-        if self.brief_done:
-            parts.append(f"Done when: {self.brief_done}")
-        return "\n\n".join(parts)
+        return (
+            self.title
+            + (f"\n\nWhy: {self.brief_why}" if self.brief_why else "")
+            + (f"\n\nWhat: {self.brief_what}" if self.brief_what else "")
+            + (f"\n\nDone when: {self.brief_done}" if self.brief_done else "")
+        )
 
     @property
     def metadata(self) -> dict:
@@ -75,48 +77,56 @@ def parse_datetime(dt_str: str | None) -> datetime | None:
         return None
 
 
+def _text(data: dict, key: str) -> str:
+    """String field that may be missing or null in bon JSON."""
+    return data.get(key) or ''
+
+
+def _item_from_data(data: dict, path: Path, default_id: str, project_path: str) -> BonSource:
+    """Build a BonSource from one decoded bon item (JSONL line or CLI output)."""
+    brief = data.get('brief') or {}
+    created_at = parse_datetime(data.get('created_at'))
+    if not created_at:
+        created_at = datetime.now()
+
+    return BonSource(
+        path=path,
+        item_id=data.get('id', default_id),
+        title=data.get('title', ''),
+        item_type=data.get('type', 'action'),
+        brief_why=_text(brief, 'why'),
+        brief_what=_text(brief, 'what'),
+        brief_done=_text(brief, 'done'),
+        status=data.get('status', 'ready'),
+        parent_id=data.get('parent'),
+        created_at=created_at,
+        done_at=parse_datetime(data.get('done_at')),
+        project_path=project_path,
+    )
+
+
 def parse_jsonl(path: Path, project_path: str) -> Iterator[BonSource]:
     """Parse items.jsonl and yield BonSource objects."""
     if not path.exists():
         return
 
-    with open(path, 'r') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
+    # One read, then decode each line from bytes (json accepts bytes directly)
+    for line_num, line in enumerate(path.read_bytes().splitlines(), 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            data = json.loads(line)
 
-                # Skip deleted items if that field exists
-                if data.get('deleted'):
-                    continue
+            # Skip deleted items if that field exists
+            if data.get('deleted'):
+                continue
 
-                brief = data.get('brief', {}) or {}
-                created_at = parse_datetime(data.get('created_at'))
-                done_at = parse_datetime(data.get('done_at'))
-
-                if not created_at:
-                    created_at = datetime.now()
-
-                yield BonSource(
-                    path=path,
-                    item_id=data.get('id', f'unknown-{line_num}'),
-                    title=data.get('title', ''),
-                    item_type=data.get('type', 'action'),
-                    brief_why=brief.get('why', '') or '',
-                    brief_what=brief.get('what', '') or '',
-                    brief_done=brief.get('done', '') or '',
-                    status=data.get('status', 'ready'),
-                    parent_id=data.get('parent'),
-                    created_at=created_at,
-                    done_at=done_at,
-                    project_path=project_path,
-                )
-            except json.JSONDecodeError as e:
-                print(f"Failed to parse line {line_num} in {path}: {e}")
-            except Exception as e:
-                print(f"Error processing bon item at line {line_num} in {path}: {e}")
+            yield _item_from_data(data, path, f'unknown-{line_num}', project_path)
+        except json.JSONDecodeError as e:
+            print(f"Failed to parse line {line_num} in {path}: {e}", file=sys.stderr)
+        except Exception as e:
+            print(f"Error processing bon item at line {line_num} in {path}: {e}", file=sys.stderr)
 
 
 def _get_backend(bon_dir: Path) -> str:
@@ -144,30 +154,35 @@ def _load_dolt_items(repo_path: Path) -> Iterator[BonSource]:
                 data = json.loads(line)
                 if data.get('deleted'):
                     continue
-                brief = data.get('brief', {}) or {}
-                created_at = parse_datetime(data.get('created_at'))
-                if not created_at:
-                    created_at = datetime.now()
-                yield BonSource(
-                    path=repo_path / ".bon",
-                    item_id=data.get('id', 'unknown'),
-                    title=data.get('title', ''),
-                    item_type=data.get('type', 'action'),
-                    brief_why=brief.get('why', '') or '',
-                    brief_what=brief.get('what', '') or '',
-                    brief_done=brief.get('done', '') or '',
-                    status=data.get('status', 'ready'),
-                    parent_id=data.get('parent'),
-                    created_at=created_at,
-                    done_at=parse_datetime(data.get('done_at')),
-                    project_path=str(repo_path),
-                )
+                yield _item_from_data(data, repo_path / ".bon", 'unknown', str(repo_path))
             except (json.JSONDecodeError, Exception):
                 continue
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return
 
 
+def _project_key(project_path: str) -> tuple[int, int] | str:
+    """Identity of a project directory for dedup.
+
+    Uses (st_dev, st_ino) so a repo reached via a symlink or two
+    overlapping patterns is only loaded once. Falls back to the path
+    string when the directory can't be stat'd.
+    """
+    try:
+        st = os.stat(project_path)
+    except OSError:
+        return project_path
+    return (st.st_dev, st.st_ino)
+
+
+def _load_job(job: tuple[Path | None, str]) -> list[BonSource]:
+    """Load all items for one discovery job (JSONL file or Dolt repo)."""
+    jsonl_path, project_path = job
+    if jsonl_path is None:
+        return list(_load_dolt_items(Path(project_path)))
+    return list(parse_jsonl(jsonl_path, project_path))
+
+
 def discover_bon(config: dict) -> Iterator[BonSource]:
     """Discover all bon items from configured paths.
 
@@ -181,6 +196,9 @@ def discover_bon(config: dict) -> Iterator[BonSource]:
     ])
 
     discovered = set()
+    # Each job is (items.jsonl path or None for Dolt, project path); jobs are
+    # collected in discovery order and loaded on a thread pool.
+    jobs: list[tuple[Path | None, str]] = []
 
     for pattern in paths:
         pattern = str(Path(pattern).expanduser())
@@ -192,34 +210,43 @@ def discover_bon(config: dict) -> Iterator[BonSource]:
             glob_pattern = pattern[len(base):]
 
             # JSONL repos: glob for items.jsonl as before
-            for jsonl_path in base_path.glob(glob_pattern.lstrip('/')):
+            for jsonl_path in glob_one_level(base_path, glob_pattern):
                 project_path = str(jsonl_path.parent.parent)
-                if project_path not in discovered:
-                    discovered.add(project_path)
+                key = _project_key(project_path)
+                if key not in discovered:
+                    discovered.add(key)
                     bon_dir = jsonl_path.parent
                     if _get_backend(bon_dir) == "dolt":
                         # items.jsonl is stale, use CLI
-                        yield from _load_dolt_items(Path(project_path))
+                        jobs.append((None, project_path))
                     else:
-                        yield from parse_jsonl(jsonl_path, project_path)
+                        jobs.append((jsonl_path, project_path))
 
             # Dolt repos: glob for .bon/backend (no items.jsonl)
             bon_glob = glob_pattern.replace("items.jsonl", "backend")
-            for backend_path in base_path.glob(bon_glob.lstrip('/')):
+            for backend_path in glob_one_level(base_path, bon_glob):
                 if backend_path.read_text().strip() != "dolt":
                     continue
                 project_path = str(backend_path.parent.parent)
-                if project_path not in discovered:
-                    discovered.add(project_path)
-                    yield from _load_dolt_items(Path(project_path))
+                key = _project_key(project_path)
+                if key not in discovered:
+                    discovered.add(key)
+                    jobs.append((None, project_path))
         else:
             jsonl_path = Path(pattern)
             project_path = str(jsonl_path.parent.parent)
-            if project_path in discovered:
+            key = _project_key(project_path)
+            if key in discovered:
                 continue
-            discovered.add(project_path)
+            discovered.add(key)
             bon_dir = jsonl_path.parent
             if _get_backend(bon_dir) == "dolt":
-                yield from _load_dolt_items(Path(project_path))
+                jobs.append((None, project_path))
             elif jsonl_path.exists():
-                yield from parse_jsonl(jsonl_path, project_path)
+                jobs.append((jsonl_path, project_path))
+
+    for (jsonl_path, project_path), items, error in parse_parallel(_load_job, jobs):
+        if error is not None:
+            print(f"Failed to load bon items for {project_path}: {error}", file=sys.stderr)
+        else:
+            yield from items
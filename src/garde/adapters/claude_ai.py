@@ -11,12 +11,15 @@ Key features:
 
 from pathlib import Path
 import json
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Iterator
 
+from ._discovery import parse_parallel
 
-@dataclass
+
+@dataclass(slots=True)
 class ClaudeAISource:
     uuid: str
     name: str
@@ -27,6 +30,7 @@ class ClaudeAISource:
     input_mode: str | None    # 'voice' or None
     messages: list
     platform: str = "CLAUDE_AI"
+    _full_text: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def source_id(self) -> str:
@@ -38,7 +42,7 @@ class ClaudeAISource:
 
     @classmethod
     def from_file(cls, path: Path) -> 'ClaudeAISource':
-        data = json.loads(path.read_text())
+        data = json.loads(path.read_bytes())
 
         # Detect voice conversation from first human message
         input_mode = None
@@ -52,24 +56,28 @@ class ClaudeAISource:
             name=data.get('name', 'Untitled'),
             summary=data.get('summary', ''),
             model=data.get('model', 'unknown'),
-            created_at=datetime.fromisoformat(data['created_at'].replace('Z', '+00:00')),
-            updated_at=datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00')),
+            created_at=datetime.fromisoformat(data['created_at']),
+            updated_at=datetime.fromisoformat(data['updated_at']),
             input_mode=input_mode,
             messages=data.get('chat_messages', []),
             platform=data.get('platform', 'CLAUDE_AI')
         )
 
-    def full_text(self) -> str:
-        """Extract all text content for entity extraction."""
-        texts = []
+    def _iter_text(self) -> Iterator[str]:
         for msg in self.messages:
             # Message text may be in 'text' field or content blocks
-            if msg.get('text'):
-                texts.append(msg['text'])
-            for block in msg.get('content', []):
+            text = msg.get('text')
+            if text:
+                yield text
+            for block in msg.get('content') or ():
                 if isinstance(block, dict) and block.get('type') == 'text':
-                    texts.append(block.get('text', ''))
-        return '\n\n'.join(texts)
+                    yield block.get('text', '')
+
+    def full_text(self) -> str:
+        """Extract all text content for entity extraction."""
+        if self._full_text is None:
+            self._full_text = '\n\n'.join(self._iter_text())
+        return self._full_text
 
 
 def discover_claude_ai(config: dict) -> Iterator[ClaudeAISource]:
@@ -81,8 +89,8 @@ def discover_claude_ai(config: dict) -> Iterator[ClaudeAISource]:
     if not path.exists():
         return
 
-    for file in path.glob(pattern):
-        try:
-            yield ClaudeAISource.from_file(file)
-        except Exception as e:
-            print(f"Failed to parse {file}: {e}")
+    for file, source, error in parse_parallel(ClaudeAISource.from_file, path.glob(pattern)):
+        if error is not None:
+            print(f"Failed to parse {file}: {error}", file=sys.stderr)
+        else:
+            yield source
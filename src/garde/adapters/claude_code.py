@@ -12,6 +12,7 @@ since deglacer doesn't cover it.
 from pathlib import Path
 import json
 import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Iterator
@@ -21,6 +22,9 @@ import deglacer as dg
 # Pattern to match git commit output: [branch hash] message
 COMMIT_PATTERN = re.compile(r"\[[\w\-/]+ ([a-f0-9]{7,})\] (.+?)(?:\n|$)")
 
+# Opening of the prompt Claude Code injects when it compacts a conversation
+COMPACTION_PREFIX = 'Context: This summary will be shown'
+
 # Pattern to strip internal XML command tags from titles
 COMMAND_TAG_PATTERN = re.compile(r'<command-\w+>.*?</command-\w+>', re.DOTALL)
 
@@ -164,7 +168,9 @@ class ClaudeCodeSource:
 
                     elif block_type == 'tool_result':
                         result_content = block.get('content', '')
-                        if isinstance(result_content, str):
+                        # Every commit line contains '] ' - skip the regex
+                        # scan on the (large, common) results that don't
+                        if isinstance(result_content, str) and '] ' in result_content:
                             for match in COMMIT_PATTERN.finditer(result_content):
                                 git_commits.append({
                                     'hash': match.group(1),
@@ -177,7 +183,7 @@ class ClaudeCodeSource:
             if first_user_content is None and role == 'user':
                 if not entry.get('isMeta'):
                     if isinstance(content, str) and content:
-                        if not content.startswith('Context: This summary will be shown'):
+                        if not content.startswith(COMPACTION_PREFIX):
                             first_user_content = content
 
         # Generate title: prefer summary, fall back to first user message
@@ -195,7 +201,7 @@ class ClaudeCodeSource:
                     raw = e.get('message', {}).get('content', '')
                     if not isinstance(raw, str):
                         continue
-                    if raw.startswith('Context: This summary will be shown'):
+                    if raw.startswith(COMPACTION_PREFIX):
                         if '<summary>' in raw and '</summary>' in raw:
                             start = raw.rfind('<summary>') + 9
                             end = raw.rfind('</summary>')
@@ -261,8 +267,11 @@ class ClaudeCodeSource:
 
         Handles compaction boundaries, deduplicates streaming entries,
         strips system tags, and preserves compaction summaries.
+        Cached: process and messages_with_offsets each ask for it.
         """
-        return dg.format_text(self._build_turns())
+        if not hasattr(self, '_full_text_cache'):
+            self._full_text_cache = dg.format_text(self._build_turns())
+        return self._full_text_cache
 
     def messages_with_offsets(self) -> list:
         """Return message metadata with character offsets into full_text.
@@ -341,6 +350,28 @@ class ClaudeCodeSource:
 
         return result
 
+
+def _has_min_lines(path: Path, min_lines: int) -> bool:
+    """Check that a file has at least min_lines lines.
+
+    Counts newlines in 64 KB binary chunks and stops once the threshold is
+    reached, so long transcripts are neither read in full nor decoded.
+    """
+    count = 0
+    last = b''
+    with path.open('rb') as f:
+        while count < min_lines:
+            chunk = f.read(65536)
+            if not chunk:
+                # A final line without a trailing newline still counts
+                if last and not last.endswith(b'\n'):
+                    count += 1
+                break
+            count += chunk.count(b'\n')
+            last = chunk
+    return count >= min_lines
+
+
 def _get_quick_summary(path: Path) -> str | None:
     """Quick scan for summary entry without full parse.
 
@@ -400,11 +431,8 @@ def discover_claude_code(config: dict) -> Iterator[ClaudeCodeSource]:
                 continue
 
             # Quick line count check for agents
-            if is_agent:
-                with jsonl_file.open() as f:
-                    line_count = sum(1 for _ in f)
-                if line_count < min_lines:
-                    continue
+            if is_agent and not _has_min_lines(jsonl_file, min_lines):
+                continue
 
             # Skip warmup/empty sessions
             quick_summary = _get_quick_summary(jsonl_file)
@@ -414,4 +442,4 @@ def discover_claude_code(config: dict) -> Iterator[ClaudeCodeSource]:
             try:
                 yield ClaudeCodeSource.from_file(jsonl_file)
             except Exception as e:
-                print(f"Failed to parse {jsonl_file}: {e}")
+                print(f"Failed to parse {jsonl_file}: {e}", file=sys.stderr)
@@ -13,16 +13,25 @@ Format is similar to local Claude Code JSONL but:
 from pathlib import Path
 import json
 import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Iterator
 
 # Reuse patterns and helpers from claude_code adapter
-from .claude_code import clean_title
+from ._discovery import parse_parallel
+from .claude_code import COMPACTION_PREFIX, clean_title
 COMMIT_PATTERN = re.compile(r"\[[\w\-/]+ ([a-f0-9]{7,})\] (.+?)(?:\n|$)")
 
+# Files below this size are checked for summary/user entries at the byte
+# level before decoding; warmup and empty sessions are typically tiny.
+SMALL_SESSION_BYTES = 8 * 1024
 
-@dataclass
+# Tools whose input carries a file_path worth recording
+FILE_TOOLS = frozenset(('Read', 'Write', 'Edit', 'Glob'))
+
+
+@dataclass(slots=True)
 class CloudSessionSource:
     """Cloud Claude Code session from JSON file."""
     path: Path
@@ -35,6 +44,7 @@ class CloudSessionSource:
     messages: list = field(default_factory=list)
     summary_text: str | None = None
     metadata: dict = field(default_factory=dict)
+    _full_text: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def source_id(self) -> str:
@@ -47,9 +57,11 @@ class CloudSessionSource:
     @classmethod
     def from_file(cls, path: Path) -> 'CloudSessionSource':
         """Parse a cloud session JSON file."""
-        with path.open() as f:
-            data = json.load(f)
+        return cls.from_data(path, _load(path))
 
+    @classmethod
+    def from_data(cls, path: Path, data: dict) -> 'CloudSessionSource':
+        """Build a source from an already-decoded session document."""
         loglines = data.get('loglines', [])
         session_id = path.stem  # session_01ABC...
 
@@ -58,13 +70,18 @@ class CloudSessionSource:
         git_branch = None
         summary_text = None
         first_user_content = None
-        timestamps = []
+        compaction_title = None
+        seen_user = False
+        # Running bounds instead of collecting every timestamp
+        first_ts = None
+        last_ts = None
         messages = []
 
         # Tool usage metadata
         tool_calls = []
-        files_touched = set()
-        skills_used = set()
+        # dicts as insertion-ordered sets: deduplicated, first-seen order
+        files_touched = {}
+        skills_used = {}
         subagents_spawned = []
         git_commits = []
 
@@ -84,10 +101,15 @@ class CloudSessionSource:
             ts_str = entry.get('timestamp')
             if ts_str:
                 try:
-                    ts = datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
-                    timestamps.append(ts)
+                    # 3.11+ fromisoformat reads the trailing 'Z' itself
+                    ts = datetime.fromisoformat(ts_str)
                 except ValueError:
                     pass
+                else:
+                    if first_ts is None or ts < first_ts:
+                        first_ts = ts
+                    if last_ts is None or ts > last_ts:
+                        last_ts = ts
 
             # Skip non-message entries
             if entry_type not in ('user', 'assistant'):
@@ -121,15 +143,15 @@ class CloudSessionSource:
                         if tool_name == 'Bash':
                             cmd = tool_input.get('command', '')
                             input_summary = cmd[:100] if cmd else None
-                        elif tool_name in ('Read', 'Write', 'Edit', 'Glob'):
+                        elif tool_name in FILE_TOOLS:
                             fp = tool_input.get('file_path', '')
                             if fp:
-                                files_touched.add(fp)
+                                files_touched[fp] = None
                                 input_summary = fp
                         elif tool_name == 'Skill':
                             skill = tool_input.get('skill', '')
                             if skill:
-                                skills_used.add(skill)
+                                skills_used[skill] = None
                                 input_summary = skill
                         elif tool_name == 'Task':
                             st = tool_input.get('subagent_type', '')
@@ -148,7 +170,9 @@ class CloudSessionSource:
 
                     elif block_type == 'tool_result':
                         result_content = block.get('content', '')
-                        if isinstance(result_content, str):
+                        # Every commit line contains '] ' - skip the regex
+                        # scan on the (large, common) results that don't
+                        if isinstance(result_content, str) and '] ' in result_content:
                             for match in COMMIT_PATTERN.finditer(result_content):
                                 git_commits.append({
                                     'hash': match.group(1),
@@ -162,8 +186,12 @@ class CloudSessionSource:
                 if entry.get('isMeta'):
                     continue
                 if isinstance(content, str) and content:
-                    if not content.startswith('Context: This summary will be shown'):
+                    if not content.startswith(COMPACTION_PREFIX):
                         first_user_content = content
+                    elif not seen_user:
+                        # Session opens with a compaction prompt - fallback title
+                        compaction_title = _compaction_title(content)
+                seen_user = True
 
             messages.append({
                 'uuid': entry.get('uuid', ''),
@@ -174,32 +202,7 @@ class CloudSessionSource:
 
         # Generate title
         title = path.stem
-        title_source = first_user_content
-
-        if summary_text:
-            title_source = summary_text
-        elif not first_user_content:
-            # Try to extract from compaction prompt
-            for msg in messages:
-                if msg.get('role') == 'user':
-                    content = msg.get('content', '')
-                    if isinstance(content, str) and content.startswith('Context: This summary will be shown'):
-                        if '<summary>' in content and '</summary>' in content:
-                            start = content.rfind('<summary>') + 9
-                            end = content.rfind('</summary>')
-                            if start < end:
-                                extracted = content[start:end].strip()
-                                if extracted and len(extracted) > 10:
-                                    title_source = extracted
-                                    break
-                        if 'User:' in content:
-                            parts = content.split('User:', 1)
-                            if len(parts) > 1:
-                                embedded = parts[1].split('Agent:', 1)[0].strip()
-                                if embedded and len(embedded) > 10:
-                                    title_source = embedded
-                                    break
-                    break
+        title_source = summary_text or first_user_content or compaction_title
 
         if title_source:
             # Clean internal markup before using as title
@@ -213,8 +216,8 @@ class CloudSessionSource:
 
         metadata = {
             'tool_calls': tool_calls,
-            'files_touched': sorted(files_touched),
-            'skills_used': sorted(skills_used),
+            'files_touched': list(files_touched),
+            'skills_used': list(skills_used),
             'subagents_spawned': subagents_spawned,
             'git_commits': git_commits,
             'tool_count': len(tool_calls),
@@ -226,8 +229,8 @@ class CloudSessionSource:
             path=path,
             session_id=session_id,
             title=title,
-            created_at=min(timestamps) if timestamps else datetime.now(),
-            updated_at=max(timestamps) if timestamps else datetime.now(),
+            created_at=first_ts if first_ts is not None else datetime.now(),
+            updated_at=last_ts if last_ts is not None else datetime.now(),
             cwd=cwd,
             git_branch=git_branch,
             messages=messages,
@@ -235,21 +238,88 @@ class CloudSessionSource:
             metadata=metadata,
         )
 
-    def full_text(self) -> str:
-        """Extract text content for indexing."""
+    @classmethod
+    def text_only(cls, path: Path, max_chars: int | None = None) -> str:
+        """Return what from_file(path).full_text() would, without building the source.
+
+        For callers that only index text: skips the message dicts, tool
+        metadata and title work. Must stay in step with from_file's
+        message filtering. With max_chars, stops collecting messages once
+        that many characters are in hand and returns the first max_chars.
+        """
+        data = _load(path)
+
         texts = []
-        for msg in self.messages:
-            content = msg.get('content', '')
+        total = 0
+        have_first_user = False
+        for entry in data.get('loglines', []):
+            entry_type = entry.get('type')
+            if entry_type not in ('user', 'assistant'):
+                continue
+
+            msg_data = entry.get('message', {})
+            role = msg_data.get('role', entry_type)
+            content = msg_data.get('content', '')
+            if isinstance(content, list):
+                text_parts = [
+                    block.get('text', '') for block in content
+                    if isinstance(block, dict) and block.get('type') == 'text'
+                ]
+                content = '\n'.join(text_parts) if text_parts else str(content)
+
+            # Mirrors from_file: meta user entries before the title message are dropped
+            if not have_first_user and role == 'user':
+                if entry.get('isMeta'):
+                    continue
+                if isinstance(content, str) and content:
+                    if not content.startswith(COMPACTION_PREFIX):
+                        have_first_user = True
+
             if isinstance(content, str) and content:
+                # Length of the joined text so far, '\n\n' separators included
+                total += len(content) + (2 if texts else 0)
                 texts.append(content)
-        return '\n\n'.join(texts)
+                if max_chars is not None and total >= max_chars:
+                    break
+        text = '\n\n'.join(texts)
+        return text if max_chars is None else text[:max_chars]
+
+    def full_text(self) -> str:
+        """Extract text content for indexing (built once, then cached)."""
+        if self._full_text is None:
+            texts = []
+            for msg in self.messages:
+                content = msg.get('content', '')
+                if isinstance(content, str) and content:
+                    texts.append(content)
+            self._full_text = '\n\n'.join(texts)
+        return self._full_text
+
+
+def _compaction_title(content: str) -> str | None:
+    """Pull a usable title out of a compaction prompt, if it carries one."""
+    if '<summary>' in content and '</summary>' in content:
+        start = content.rfind('<summary>') + 9
+        end = content.rfind('</summary>')
+        if start < end:
+            extracted = content[start:end].strip()
+            if extracted and len(extracted) > 10:
+                return extracted
+    if 'User:' in content:
+        embedded = content.split('User:', 1)[1].split('Agent:', 1)[0].strip()
+        if embedded and len(embedded) > 10:
+            return embedded
+    return None
 
 
-def _get_quick_summary(path: Path) -> str | None:
-    """Quick scan for summary without full parse."""
+def _load(path: Path) -> dict:
+    """Decode a session file (json accepts the raw bytes directly)."""
+    return json.loads(path.read_bytes())
+
+
+def _quick_summary(path: Path, data: dict) -> str | None:
+    """Quick scan of a decoded session for summary or first user text."""
     try:
-        with path.open() as f:
-            data = json.load(f)
         loglines = data.get('loglines', [])
 
         for entry in loglines:
@@ -266,11 +336,33 @@ def _get_quick_summary(path: Path) -> str | None:
                 elif isinstance(content, str):
                     return content[:100]
     except Exception as e:
-        import sys
         print(f"Warning: Failed to parse {path.name}: {e}", file=sys.stderr)
     return None
 
 
+def _parse_session(json_file: Path) -> CloudSessionSource | None:
+    """Load one session file, or None for unreadable, warmup and empty sessions."""
+    # Decode once; the same document feeds the warmup check and the full parse
+    try:
+        raw = json_file.read_bytes()
+        # A session with neither a summary nor a user entry has no quick
+        # summary and would be skipped below - don't bother decoding it
+        if (len(raw) < SMALL_SESSION_BYTES
+                and b'"summary"' not in raw and b'"user"' not in raw):
+            return None
+        data = json.loads(raw)
+    except Exception as e:
+        print(f"Warning: Failed to parse {json_file.name}: {e}", file=sys.stderr)
+        return None
+
+    # Skip warmup/empty sessions
+    quick_summary = _quick_summary(json_file, data)
+    if quick_summary is None or quick_summary.lower() == 'warmup':
+        return None
+
+    return CloudSessionSource.from_data(json_file, data)
+
+
 def discover_cloud_sessions(config: dict) -> Iterator[CloudSessionSource]:
     """Discover cloud Claude Code sessions."""
     source_config = config.get('sources', {}).get('cloud_sessions', {})
@@ -279,13 +371,8 @@ def discover_cloud_sessions(config: dict) -> Iterator[CloudSessionSource]:
     if not base_path.exists():
         return
 
-    for json_file in base_path.glob('session_*.json'):
-        # Skip warmup/empty sessions
-        quick_summary = _get_quick_summary(json_file)
-        if quick_summary is None or quick_summary.lower() == 'warmup':
-            continue
-
-        try:
-            yield CloudSessionSource.from_file(json_file)
-        except Exception as e:
-            print(f"Failed to parse {json_file}: {e}")
+    for json_file, source, error in parse_parallel(_parse_session, base_path.glob('session_*.json')):
+        if error is not None:
+            print(f"Failed to parse {json_file}: {error}", file=sys.stderr)
+        elif source is not None:
+            yield source
@@ -34,11 +34,38 @@ Key features:
 """
 
 from pathlib import Path
+import os
 import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Iterator
 
+from ._discovery import iter_files, parse_parallel
+
+
+# Header: "# Handoff — 2025-12-26 (momentum)"
+HEADER_PATTERN = re.compile(r'^# Handoff — (\d{4}-\d{2}-\d{2})(?: \((\w+)\))?')
+DATE_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2})')
+# Filename suffix: "project-name-2025-12-26-1019"
+TRAILING_DATETIME_PATTERN = re.compile(r'-\d{4}-\d{2}-\d{2}-\d{4}$')
+BARE_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+ZONE_PATTERN = re.compile(r'^## (?:Now|Compost)\b', re.MULTILINE)
+H2_PATTERN = re.compile(r'^## ', re.MULTILINE)
+
+COMMIT_ITEM_PATTERN = re.compile(r'^([0-9a-f]{7,}) (.+)')
+PARAGRAPH_BREAK_PATTERN = re.compile(r'\n\n+')
+LABEL_PATTERN = re.compile(r'\*\*(.+?):\*\*\s*(.*)', re.DOTALL)
+
+HOME = str(Path.home())
+# Known base path patterns for encoded parent dirs (order matters - more specific first)
+PARENT_DIR_PATTERNS = (
+    ('-Repos-', f'{HOME}/Repos/'),
+    ('-.claude-', f'{HOME}/.claude/'),
+    ('-.claude', f'{HOME}/.claude'),  # Exact match for .claude itself
+)
+
 
 def decode_parent_dir(parent_name: str) -> tuple[str, str]:
     """Decode parent directory name to (project_name, project_path).
@@ -48,16 +75,7 @@ def decode_parent_dir(parent_name: str) -> tuple[str, str]:
 
     Returns: (project_name, project_path)
     """
-    home = str(Path.home())
-
-    # Known base path patterns (order matters - more specific first)
-    patterns = [
-        ('-Repos-', f'{home}/Repos/'),
-        ('-.claude-', f'{home}/.claude/'),
-        ('-.claude', f'{home}/.claude'),  # Exact match for .claude itself
-    ]
-
-    for marker, base_path in patterns:
+    for marker, base_path in PARENT_DIR_PATTERNS:
         if marker in parent_name:
             # Split on marker, take everything after as project name
             parts = parent_name.split(marker, 1)
@@ -67,7 +85,7 @@ def decode_parent_dir(parent_name: str) -> tuple[str, str]:
                 return project_name, project_path
             elif marker == '-.claude' and (not parts[1] if len(parts) == 2 else True):
                 # Exact match: parent is just "-Users-username-.claude"
-                return 'claude-config', f'{home}/.claude'
+                return 'claude-config', f'{HOME}/.claude'
 
     # Fallback: try to reconstruct path and extract last segment as project name
     # -Users-foo-Documents-MyProject -> /Users/foo/Documents/MyProject
@@ -107,44 +125,38 @@ def _parse_sections(content: str) -> dict[str, str]:
     not content-bearing.
     """
     # Detect two-zone format by looking for ## Now or ## Compost
-    has_zones = bool(re.search(r'^## (?:Now|Compost)\b', content, re.MULTILINE))
+    has_zones = bool(ZONE_PATTERN.search(content))
 
+    # Split on heading markers rather than regex-scanning for each one;
+    # the leading newline lets a heading on the first line split too.
+    # Chunk 0 is whatever precedes the first heading.
+    sections = {}
     if has_zones:
         # Parse h3 subsections as the meaningful sections
-        sections = {}
-        pattern = re.compile(r'^### (.+?)\s*$', re.MULTILINE)
-        matches = list(pattern.finditer(content))
-        for i, match in enumerate(matches):
-            name = match.group(1).strip()
-            start = match.end()
-            # End at next h2 or h3, whichever comes first
-            end = len(content)
-            for j in range(i + 1, len(matches)):
-                end = matches[j].start()
-                break
-            # Also check for h2 boundaries within the range
-            next_h2 = re.search(r'^## ', content[start:end], re.MULTILINE)
-            if next_h2:
-                end = start + next_h2.start()
-            sections[name] = content[start:end].strip()
-        return sections
+        for chunk in ('\n' + content).split('\n### ')[1:]:
+            name, _, text = chunk.partition('\n')
+            name = name.strip()
+            if not name:
+                continue
+            # A subsection also ends at the next h2 (zone boundary)
+            next_h2 = ('\n' + text).find('\n## ')
+            if next_h2 != -1:
+                text = text[:next_h2]
+            sections[name] = text.strip()
     else:
         # Old format: flat h2 sections
-        sections = {}
-        pattern = re.compile(r'^## (.+?)\s*$', re.MULTILINE)
-        matches = list(pattern.finditer(content))
-        for i, match in enumerate(matches):
-            name = match.group(1).strip()
-            start = match.end()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
-            sections[name] = content[start:end].strip()
-        return sections
+        for chunk in ('\n' + content).split('\n## ')[1:]:
+            name, _, text = chunk.partition('\n')
+            name = name.strip()
+            if name:
+                sections[name] = text.strip()
+    return sections
 
 
 def _parse_preamble(content: str) -> dict[str, str]:
     """Extract session_id and purpose from preamble lines before the first h2 section."""
     preamble = {}
-    first_h2 = re.search(r'^## ', content, re.MULTILINE)
+    first_h2 = H2_PATTERN.search(content)
     text = content[:first_h2.start()] if first_h2 else content
     for line in text.splitlines():
         if line.startswith('session_id:'):
@@ -154,7 +166,7 @@ def _parse_preamble(content: str) -> dict[str, str]:
     return preamble
 
 
-@dataclass
+@dataclass(slots=True)
 class HandoffSource:
     """A handoff file from Claude Code session."""
     path: Path
@@ -237,7 +249,7 @@ class HandoffSource:
                 if line.startswith('- '):
                     item = line[2:].strip()
                     # Check for "commit_hash description" pattern
-                    commit_match = re.match(r'^([0-9a-f]{7,}) (.+)', item)
+                    commit_match = COMMIT_ITEM_PATTERN.match(item)
                     if commit_match:
                         builds.append({'what': commit_match.group(2),
                                        'details': f'commit {commit_match.group(1)}'})
@@ -274,12 +286,12 @@ class HandoffSource:
             text = s['Reflection'].strip()
             if text:
                 # Split on paragraph boundaries (double newline or bold markers)
-                paragraphs = re.split(r'\n\n+', text)
+                paragraphs = PARAGRAPH_BREAK_PATTERN.split(text)
                 for para in paragraphs:
                     para = para.strip()
                     if para:
                         # Extract labelled parts: "**Claude observed:** ..." or "**User noted:** ..."
-                        label_match = re.match(r'\*\*(.+?):\*\*\s*(.*)', para, re.DOTALL)
+                        label_match = LABEL_PATTERN.match(para)
                         if label_match:
                             learnings.append({
                                 'insight': label_match.group(2).strip(),
@@ -331,25 +343,24 @@ class HandoffSource:
         }
 
     @classmethod
-    def from_file(cls, path: Path) -> 'HandoffSource':
+    def from_file(cls, path: Path, stat_result: os.stat_result | None = None) -> 'HandoffSource':
+        # Discovery passes the stat it already has from the directory walk
+        stat = stat_result if stat_result is not None else path.stat()
         content = path.read_text()
 
         # Parse header: # Handoff — 2025-12-26 (momentum)
-        header_match = re.match(
-            r'^# Handoff — (\d{4}-\d{2}-\d{2})(?: \((\w+)\))?',
-            content
-        )
+        header_match = HEADER_PATTERN.match(content)
         if header_match:
             date = datetime.strptime(header_match.group(1), "%Y-%m-%d")
             mood = header_match.group(2)
         else:
             # Fallback: extract date from filename
             # Format: project-name-2025-12-26-1019.md
-            date_match = re.search(r'(\d{4}-\d{2}-\d{2})', path.stem)
+            date_match = DATE_PATTERN.search(path.stem)
             if date_match:
                 date = datetime.strptime(date_match.group(1), "%Y-%m-%d")
             else:
-                date = datetime.fromtimestamp(path.stat().st_mtime)
+                date = datetime.fromtimestamp(stat.st_mtime)
             mood = None
 
         # Extract project info from parent directory (new structure)
@@ -361,9 +372,9 @@ class HandoffSource:
         if not project_name:
             stem = path.stem
             # Remove date-time suffix: project-name-2025-12-26-1019.md
-            project_name = re.sub(r'-\d{4}-\d{2}-\d{2}-\d{4}$', '', stem)
+            project_name = TRAILING_DATETIME_PATTERN.sub('', stem)
             # If still looks like a bare timestamp, use parent dir name as-is
-            if re.match(r'^\d{4}-\d{2}-\d{2}$', project_name):
+            if BARE_DATE_PATTERN.match(project_name):
                 project_name = parent_name.lstrip('-').split('-')[-1] or 'unknown'
 
         # Parse sections (handles both old flat h2 and new two-zone format)
@@ -381,7 +392,7 @@ class HandoffSource:
             sections=sections,
             purpose=preamble.get('purpose'),
             session_id=preamble.get('session_id'),
-            mtime=path.stat().st_mtime,
+            mtime=stat.st_mtime,
         )
 
 
@@ -400,14 +411,16 @@ def discover_handoffs(config: dict) -> Iterator[HandoffSource]:
 
     seen_stems: set[str] = set()
 
+    def parse(item: tuple[Path, os.stat_result]) -> HandoffSource:
+        return HandoffSource.from_file(item[0], stat_result=item[1])
+
     if legacy_path.exists():
-        for file in legacy_path.glob(pattern):
-            try:
-                source = HandoffSource.from_file(file)
-                seen_stems.add(file.stem)
-                yield source
-            except Exception as e:
-                print(f"Failed to parse {file}: {e}")
+        for (file, _), source, error in parse_parallel(parse, iter_files(legacy_path, pattern)):
+            if error is not None:
+                print(f"Failed to parse {file}: {error}", file=sys.stderr)
+                continue
+            seen_stems.add(file.stem)
+            yield source
 
     # Bon handoffs: scan .bon/handoffs/ in configured repo roots
     bon_handoff_dirs = source_config.get('bon_handoff_dirs', [])
@@ -419,16 +432,21 @@ def discover_handoffs(config: dict) -> Iterator[HandoffSource]:
                 if repo.is_dir():
                     bon_handoff_dirs.append(str(repo))
 
-    for dir_path in bon_handoff_dirs:
-        handoff_dir = Path(dir_path).expanduser()
-        if not handoff_dir.exists():
-            continue
-        for file in handoff_dir.glob('*.md'):
-            if file.stem in seen_stems:
+    def _bon_files() -> Iterator[tuple[Path, os.stat_result]]:
+        for dir_path in bon_handoff_dirs:
+            handoff_dir = Path(dir_path).expanduser()
+            if not handoff_dir.exists():
                 continue
-            try:
-                source = HandoffSource.from_file(file)
-                seen_stems.add(file.stem)
-                yield source
-            except Exception as e:
-                print(f"Failed to parse {file}: {e}")
+            for file, stat in iter_files(handoff_dir, '*.md'):
+                if file.stem not in seen_stems:
+                    yield file, stat
+
+    # Parsed in parallel; first successfully parsed file wins for a given stem
+    for (file, _), source, error in parse_parallel(parse, _bon_files()):
+        if file.stem in seen_stems:
+            continue
+        if error is not None:
+            print(f"Failed to parse {file}: {error}", file=sys.stderr)
+            continue
+        seen_stems.add(file.stem)
+        yield source
@@ -15,20 +15,26 @@ Key differences from local_md:
 """
 
 from pathlib import Path
-import re
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Iterator
 
+from ._discovery import iter_files
+from .local_md import first_h1_title
 
-@dataclass
+
+@dataclass(slots=True)
 class KnowledgeSource:
-    """A curated knowledge article."""
+    """A curated knowledge article.
+
+    Like LocalMdSource, the file is only read when content or title is needed.
+    """
     path: Path
     base_path: Path
-    title: str
-    content: str
     mtime: float
+    _content: str | None = field(default=None, init=False, repr=False, compare=False)
+    _title: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def source_id(self) -> str:
@@ -56,6 +62,24 @@ class KnowledgeSource:
         """Use file modification time as date."""
         return datetime.fromtimestamp(self.mtime)
 
+    def load(self) -> str:
+        """Read the file if it hasn't been read yet; return its content."""
+        if self._content is None:
+            self._content = self.path.read_text(errors='replace')
+        return self._content
+
+    @property
+    def content(self) -> str:
+        """File content, read on first access."""
+        return self.load()
+
+    @property
+    def title(self) -> str:
+        """First H1, or the filename."""
+        if self._title is None:
+            self._title = first_h1_title(self.content) or self.path.stem
+        return self._title
+
     def full_text(self) -> str:
         """Return content for indexing.
 
@@ -65,26 +89,16 @@ class KnowledgeSource:
         return self.content
 
     @classmethod
-    def from_file(cls, path: Path, base_path: Path) -> 'KnowledgeSource':
-        """Create KnowledgeSource from a file."""
-        stat = path.stat()
-        mtime = stat.st_mtime
-        content = path.read_text(errors='replace')
-
-        # Extract title from first H1, or use filename
-        h1_match = re.match(r'^#\s+(.+)$', content, re.MULTILINE)
-        if h1_match:
-            title = h1_match.group(1).strip()
-        else:
-            # Use filename without extension
-            title = path.stem
-
+    def from_file(
+        cls, path: Path, base_path: Path, stat_result: os.stat_result | None = None
+    ) -> 'KnowledgeSource':
+        """Create KnowledgeSource from a file (stat only; content loads lazily)."""
+        # Discovery passes the stat it already has from the directory walk
+        stat = stat_result if stat_result is not None else path.stat()
         return cls(
             path=path,
             base_path=base_path,
-            title=title,
-            content=content,
-            mtime=mtime,
+            mtime=stat.st_mtime,
         )
 
 
@@ -119,9 +133,6 @@ def discover_knowledge(config: dict) -> Iterator[KnowledgeSource]:
             # Silent skip — path may not exist
             continue
 
-        for file in base_path.glob(pattern):
-            if file.is_file():
-                try:
-                    yield KnowledgeSource.from_file(file, base_path)
-                except Exception as e:
-                    print(f"Failed to parse knowledge file {file}: {e}")
+        # Stat-only: the walk's stat is all a source needs until it's read
+        for file, stat in iter_files(base_path, pattern):
+            yield KnowledgeSource.from_file(file, base_path, stat_result=stat)
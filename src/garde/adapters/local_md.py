@@ -11,21 +11,54 @@ Files are indexed by their content directly (no LLM summarization by default).
 """
 
 from pathlib import Path
+import os
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Iterator
 
+from ._discovery import iter_files
 
-@dataclass
+
+# Filename cleanup: "202205261634 tv squared-2022-05-26" -> "tv squared"
+LEADING_TIMESTAMP_PATTERN = re.compile(r'^\d{12}\s*')
+TRAILING_DATE_PATTERN = re.compile(r'-\d{4}-\d{2}-\d{2}$')
+# Filename dates: YYYYMMDDHHmm or YYYY-MM-DD
+TIMESTAMP_DATE_PATTERN = re.compile(r'(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})')
+ISO_DATE_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+
+def first_h1_title(content: str) -> str | None:
+    """Return the H1 heading text if the document opens with one.
+
+    Skips a leading YAML frontmatter block and blank lines, then looks at
+    the first line only - plain string checks, no regex.
+    """
+    if content.startswith('---\n'):
+        end = content.find('\n---\n', 3)
+        if end != -1:
+            content = content[end + 5:]
+    content = content.lstrip()
+    first_nl = content.find('\n')
+    line0 = content[:first_nl] if first_nl != -1 else content
+    if line0[:1] == '#' and line0[1:2] in (' ', '\t'):
+        return line0[2:].strip() or None
+    return None
+
+
+@dataclass(slots=True)
 class LocalMdSource:
-    """A local markdown file."""
+    """A local markdown file.
+
+    Built from a stat alone; the file is read the first time content or
+    title is needed, so scan's mtime check never opens unchanged files.
+    """
     path: Path
     base_path: Path          # The configured root directory
-    title: str
     date: datetime
-    content: str
     mtime: float             # File modification time (for change detection)
+    _content: str | None = field(default=None, init=False, repr=False, compare=False)
+    _title: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def source_id(self) -> str:
@@ -44,33 +77,50 @@ class LocalMdSource:
         # Return the base path as "project"
         return str(self.base_path)
 
+    def load(self) -> str:
+        """Read the file if it hasn't been read yet; return its content."""
+        if self._content is None:
+            self._content = self.path.read_text(errors='replace')
+        return self._content
+
+    @property
+    def content(self) -> str:
+        """File content, read on first access."""
+        return self.load()
+
+    @property
+    def title(self) -> str:
+        """First H1, or the filename with timestamps stripped."""
+        if self._title is None:
+            # Extract title from first H1, or filename
+            title = first_h1_title(self.content)
+            if title is None:
+                # Use filename without extension
+                title = self.path.stem
+                # Clean up common patterns like "202205261634 tv squared-2022-05-26"
+                # Remove leading timestamp
+                title = LEADING_TIMESTAMP_PATTERN.sub('', title)
+                # Remove trailing date
+                title = TRAILING_DATE_PATTERN.sub('', title)
+                title = title.strip(' -')
+            self._title = title
+        return self._title
+
     def full_text(self) -> str:
         """Return content for indexing."""
         return self.content
 
     @classmethod
-    def from_file(cls, path: Path, base_path: Path) -> 'LocalMdSource':
-        stat = path.stat()
+    def from_file(
+        cls, path: Path, base_path: Path, stat_result: os.stat_result | None = None
+    ) -> 'LocalMdSource':
+        # Discovery passes the stat it already has from the directory walk
+        stat = stat_result if stat_result is not None else path.stat()
         mtime = stat.st_mtime
-        content = path.read_text(errors='replace')
-
-        # Extract title from first H1, or filename
-        h1_match = re.match(r'^#\s+(.+)$', content, re.MULTILINE)
-        if h1_match:
-            title = h1_match.group(1).strip()
-        else:
-            # Use filename without extension
-            title = path.stem
-            # Clean up common patterns like "202205261634 tv squared-2022-05-26"
-            # Remove leading timestamp
-            title = re.sub(r'^\d{12}\s*', '', title)
-            # Remove trailing date
-            title = re.sub(r'-\d{4}-\d{2}-\d{2}$', '', title)
-            title = title.strip(' -')
 
         # Extract date from filename or file mtime
         # Patterns: "202205261634 ..." or "2022-05-26" in filename
-        date_match = re.search(r'(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})', path.stem)
+        date_match = TIMESTAMP_DATE_PATTERN.search(path.stem)
         if date_match:
             # YYYYMMDDHHmm format
             date = datetime(
@@ -82,7 +132,7 @@ class LocalMdSource:
             )
         else:
             # Try YYYY-MM-DD format
-            date_match = re.search(r'(\d{4})-(\d{2})-(\d{2})', path.stem)
+            date_match = ISO_DATE_PATTERN.search(path.stem)
             if date_match:
                 date = datetime(
                     int(date_match.group(1)),
@@ -96,9 +146,7 @@ class LocalMdSource:
         return cls(
             path=path,
             base_path=base_path,
-            title=title,
             date=date,
-            content=content,
             mtime=mtime,
         )
 
@@ -128,9 +176,6 @@ def discover_local_md(config: dict) -> Iterator[LocalMdSource]:
             # Silent skip — path may not exist on all platforms (e.g., Linux vs macOS)
             continue
 
-        for file in base_path.glob(pattern):
-            if file.is_file():
-                try:
-                    yield LocalMdSource.from_file(file, base_path)
-                except Exception as e:
-                    print(f"Failed to parse {file}: {e}")
+        # Stat-only: the walk's stat is all a source needs until it's read
+        for file, stat in iter_files(base_path, pattern):
+            yield LocalMdSource.from_file(file, base_path, stat_result=stat)
@@ -1,8 +1,97 @@
 """Shared helper functions for CLI commands."""
 
 import json
+import os
 import re
+from collections import defaultdict
 from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+
+import click
+
+from ..adapters.claude_code import COMPACTION_PREFIX
+
+
+SUMMARY_TAG_PATTERN = re.compile(r'<summary>\s*(.*?)\s*</summary>', re.DOTALL)
+# Group 1: a quoted span; group 2: a bare hyphenated term (FTS5 would read '-' as NOT)
+QUOTED_OR_HYPHENATED_PATTERN = re.compile(r'("[^"]*"?)|\b(\w+(?:-\w+)+)\b')
+# Search tokens: a quoted phrase or a run of non-space characters (or the whitespace between)
+QUERY_TOKEN_PATTERN = re.compile(r'"[^"]*"|\S+|\s+')
+# FTS5 operators that should not be wildcarded
+FTS5_OPERATORS = frozenset({'AND', 'OR', 'NOT', 'NEAR'})
+
+
+@lru_cache(maxsize=8)
+def _resolve_git_root(cwd: str) -> str | None:
+    """Return the git repo root containing cwd, or None if it isn't in a repo.
+
+    Walks up from cwd looking for a .git entry (a directory, or the file
+    that worktrees and submodules use) - one stat per level, no git process.
+    Cached per cwd for the life of the process.
+    """
+    start = Path(cwd).resolve()
+    for p in (start, *start.parents):
+        if (p / '.git').exists():
+            return str(p)
+    return None
+
+
+class _EchoBuffer:
+    """Collects output lines and writes them with one click.echo per flush.
+
+    click.echo writes and flushes stdout on every call, which adds up when
+    a command reports thousands of items.
+    """
+
+    def __init__(self, flush_every: int = 1000):
+        self.flush_every = flush_every
+        self._lines: list[str] = []
+
+    def echo(self, line: str = '') -> None:
+        self._lines.append(line)
+        if len(self._lines) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._lines:
+            click.echo('\n'.join(self._lines))
+            self._lines.clear()
+
+
+def _missing_paths(sources: list[dict]) -> list[dict]:
+    """Return the sources whose 'path' no longer exists, in input order.
+
+    Sources are grouped by parent directory and each directory is listed
+    once, rather than stat-ing every path. Means the same as Path.exists():
+    symlinks in the listing are followed, and names the listing lacks are
+    checked directly (a case-insensitive filesystem may still find them).
+    Directories that can't be listed for other reasons than being gone
+    fall back to per-path checks.
+    """
+    by_dir: dict[str, list[tuple[int, str]]] = defaultdict(list)
+    for i, source in enumerate(sources):
+        if source['path']:
+            parent, name = os.path.split(source['path'].rstrip('/'))
+            by_dir[parent].append((i, name))
+
+    missing = set()
+    for parent, entries in by_dir.items():
+        try:
+            with os.scandir(parent or '.') as listing:
+                symlinks = {entry.name: entry.is_symlink() for entry in listing}
+        except (FileNotFoundError, NotADirectoryError):
+            missing.update(i for i, _ in entries)
+            continue
+        except OSError:
+            missing.update(i for i, _ in entries if not Path(sources[i]['path']).exists())
+            continue
+        for i, name in entries:
+            # A plain entry exists; symlinks and unlisted names need a real check
+            if (name not in symlinks or symlinks[name]) and not Path(sources[i]['path']).exists():
+                missing.add(i)
+
+    return [source for i, source in enumerate(sources) if i in missing]
 
 
 def _extract_compacted_summary(content: str) -> str | None:
@@ -12,7 +101,10 @@ def _extract_compacted_summary(content: str) -> str | None:
     Compacted conversations have <summary>...</summary> tags containing
     the actual summary, buried in the compaction prompt.
     """
-    match = re.search(r'<summary>\s*(.*?)\s*</summary>', content, re.DOTALL)
+    # Most turns have no tag at all; skip the regex for them
+    if '<summary>' not in content:
+        return None
+    match = SUMMARY_TAG_PATTERN.search(content)
     if match:
         return match.group(1).strip()
     return None
@@ -20,7 +112,7 @@ def _extract_compacted_summary(content: str) -> str | None:
 
 def _is_compacted_conversation(first_message: str) -> bool:
     """Check if conversation starts with compaction prompt."""
-    return first_message.startswith('Context: This summary will be shown')
+    return first_message.startswith(COMPACTION_PREFIX)
 
 
 def _create_basic_summary(source) -> str:
@@ -36,55 +128,57 @@ def _create_basic_summary(source) -> str:
 
     # Use deglacer turns (tag-stripped, deduplicated, tool results excluded)
     turns = source._build_turns()
-    human_turns = [t for t in turns if t['role'] == 'human']
-
-    # Check for compacted conversation
-    first_user_text = human_turns[0]['text'].strip() if human_turns else None
-
-    if first_user_text and _is_compacted_conversation(first_user_text):
-        # Look for summary tags in any turn
-        for t in turns:
-            extracted = _extract_compacted_summary(t['text'])
-            if extracted:
-                return extracted
-        # Fallback: use embedded content after "User:" marker
-        if 'User:' in first_user_text:
-            parts = first_user_text.split('User:', 1)
-            if len(parts) > 1:
-                embedded = parts[1].split('Agent:', 1)[0].strip()
-                if embedded and len(embedded) > 20:
-                    return embedded[:500]
-
-    # Normal conversation: use title + first messages
-    parts = [source.title]
 
+    # One pass collects the first user text, the first <summary> tag (only
+    # wanted for compacted conversations) and up to three user messages.
+    first_user_text = None
+    compacted = None  # Unknown until the first human turn
+    tag_summary = None
     user_messages = []
-    for t in human_turns:
-        text = t['text'].strip()
-        if text and not _is_compacted_conversation(text):
-            user_messages.append(text)
-        if len(user_messages) >= 3:
+    for t in turns:
+        if compacted is not False and not tag_summary:
+            tag_summary = _extract_compacted_summary(t['text'])
+        if t['role'] == 'human':
+            text = t['text'].strip()
+            is_prompt = _is_compacted_conversation(text)
+            if compacted is None:
+                first_user_text = text
+                compacted = bool(text) and is_prompt
+            if text and len(user_messages) < 3 and not is_prompt:
+                user_messages.append(text)
+        if compacted and tag_summary:
+            return tag_summary
+        if compacted is False and len(user_messages) >= 3:
             break
 
+    # Compacted without a summary tag: use embedded content after "User:" marker
+    if compacted and 'User:' in first_user_text:
+        embedded = first_user_text.split('User:', 1)[1].split('Agent:', 1)[0].strip()
+        if embedded and len(embedded) > 20:
+            return embedded[:500]
+
+    # Normal conversation: use title + first messages
+    parts = [source.title]
     if user_messages:
-        parts.append("\n\n".join(user_messages[:3]))
+        parts.append("\n\n".join(user_messages))
 
     return "\n\n".join(parts)
 
 
-def _format_date(date_str: str) -> str:
-    """Format date as relative (if recent) or absolute."""
-    try:
-        # Parse ISO format, handle various formats
-        if 'T' in date_str:
-            if '+' in date_str or date_str.endswith('Z'):
-                dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            else:
-                dt = datetime.fromisoformat(date_str).replace(tzinfo=timezone.utc)
-        else:
-            dt = datetime.fromisoformat(date_str).replace(tzinfo=timezone.utc)
+def _format_date(date_str: str, now: datetime | None = None) -> str:
+    """Format date as relative (if recent) or absolute.
 
-        now = datetime.now(timezone.utc)
+    Callers formatting many rows can pass one shared (UTC-aware) now.
+    """
+    try:
+        # One parse: 3.11+ fromisoformat reads offsets and a trailing 'Z';
+        # naive timestamps are stored as UTC
+        dt = datetime.fromisoformat(date_str)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+
+        if now is None:
+            now = datetime.now(timezone.utc)
         diff = now - dt
 
         if diff.days == 0:
@@ -112,36 +206,20 @@ def _auto_quote_hyphenated(query: str) -> str:
     Leaves already-quoted terms alone.
     Example: 'claude-memory foo' -> '"claude-memory" foo'
     """
-    # Find hyphenated terms that aren't already inside quotes
-    result = []
-    in_quotes = False
-    i = 0
-
-    while i < len(query):
-        if query[i] == '"':
-            # Toggle quote state and include the quote
-            in_quotes = not in_quotes
-            result.append(query[i])
-            i += 1
-        elif not in_quotes:
-            # Look for hyphenated word
-            match = re.match(r'\b(\w+(?:-\w+)+)\b', query[i:])
-            if match:
-                # Found hyphenated term outside quotes - wrap it
-                result.append(f'"{match.group(1)}"')
-                i += match.end()
-            else:
-                result.append(query[i])
-                i += 1
-        else:
-            result.append(query[i])
-            i += 1
-
-    return ''.join(result)
+    # Most queries have no hyphen at all, and then there is nothing to quote
+    if '-' not in query:
+        return query
+    # Quoted spans (closed or running to the end) match first and are kept
+    return QUOTED_OR_HYPHENATED_PATTERN.sub(
+        lambda m: m.group(1) or f'"{m.group(2)}"', query
+    )
 
 
 def _expand_query(query: str, glossary) -> str:
     """Expand query terms using glossary aliases."""
+    # Nothing to expand with; skip the lookup entirely
+    if not glossary.entities:
+        return query
     # Check if any glossary entity matches
     resolved = glossary.resolve(query)
     if resolved:
@@ -168,31 +246,40 @@ def _add_wildcard_suffix(query: str) -> str:
         'OAuth OR JWT' -> 'OAuth* OR JWT*'
         'OAuth NOT old' -> 'OAuth* NOT old*'
     """
-    # FTS5 operators that should not be wildcarded
-    operators = {'AND', 'OR', 'NOT', 'NEAR'}
-
-    tokens = []
-    # Split on whitespace while preserving quoted strings
-    pattern = r'"[^"]*"|\S+'
-
-    for match in re.finditer(pattern, query):
-        token = match.group()
-
-        # Skip if:
-        # - Already quoted (phrase search)
-        # - Already has wildcard
-        # - Is an FTS5 operator
-        # - Contains column prefix (e.g., title:foo)
-        if (token.startswith('"') or
-            token.endswith('*') or
-            token.upper() in operators or
-            ':' in token):
-            tokens.append(token)
-        else:
-            # Add wildcard suffix
-            tokens.append(token + '*')
-
-    return ' '.join(tokens)
+    # Common case: a single bare word (no quotes, spaces, ':' or '*')
+    if query.isidentifier() and query.upper() not in FTS5_OPERATORS:
+        return query + '*'
+    # One pass: tokens come back with a trailing separator, whitespace runs
+    # vanish - the same result as joining the tokens with single spaces
+    return QUERY_TOKEN_PATTERN.sub(_wildcard_token, query).rstrip(' ')
+
+
+def _wildcard_token(match: re.Match) -> str:
+    """re.sub callback for _add_wildcard_suffix."""
+    token = match.group()
+    if token.isspace():
+        return ''
+    # Skip if:
+    # - Already quoted (phrase search)
+    # - Already has wildcard
+    # - Is an FTS5 operator
+    # - Contains column prefix (e.g., title:foo)
+    if (token.startswith('"') or
+        token.endswith('*') or
+        token.upper() in FTS5_OPERATORS or
+        ':' in token):
+        return token + ' '
+    # Add wildcard suffix
+    return token + '* '
+
+
+def _json_list(value) -> list:
+    """A list field as Python: DB rows hold JSON text, fresh extractions hold lists."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        return json.loads(value)
+    return value
 
 
 def _flatten_extraction_for_fts(extraction: dict) -> str:
@@ -207,9 +294,7 @@ def _flatten_extraction_for_fts(extraction: dict) -> str:
         parts.append(extraction['summary'])
 
     # Learnings
-    learnings = extraction.get('learnings') or []
-    if isinstance(learnings, str):
-        learnings = json.loads(learnings)
+    learnings = _json_list(extraction.get('learnings'))
     for l in learnings:
         if isinstance(l, dict):
             if l.get('insight'):
@@ -220,9 +305,7 @@ def _flatten_extraction_for_fts(extraction: dict) -> str:
             parts.append(f"Learning: {l}")
 
     # Builds
-    builds = extraction.get('builds') or []
-    if isinstance(builds, str):
-        builds = json.loads(builds)
+    builds = _json_list(extraction.get('builds'))
     for b in builds:
         if isinstance(b, dict):
             if b.get('what'):
@@ -233,9 +316,7 @@ def _flatten_extraction_for_fts(extraction: dict) -> str:
             parts.append(f"Built: {b}")
 
     # Friction
-    friction = extraction.get('friction') or []
-    if isinstance(friction, str):
-        friction = json.loads(friction)
+    friction = _json_list(extraction.get('friction'))
     for f in friction:
         if isinstance(f, dict):
             if f.get('problem'):
@@ -1,17 +1,24 @@
 """Browse commands — read-only queries against the database."""
 
 import json
-import subprocess
+import os
+import re
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import click
 
-from ..config import load_config, get_memory_dir
+from ..config import encode_cwd, load_config, get_memory_dir
 from ..database import get_database
 from . import main
-from ._helpers import _format_date, _auto_quote_hyphenated, _expand_query, _add_wildcard_suffix
+from ._helpers import (
+    _format_date, _auto_quote_hyphenated, _expand_query, _add_wildcard_suffix, _missing_paths,
+    _resolve_git_root, _EchoBuffer,
+)
+
+# Hyphenated terms, for suggesting quotes when FTS5 rejects a query
+HYPHENATED_TERM_PATTERN = re.compile(r'\b\w+-\w+\b')
 
 
 @main.command()
@@ -41,16 +48,13 @@ def status(ctx):
 
     # Check for stale sources
     already_stale = stats['by_status'].get('stale', 0)
-    newly_stale = 0
     with db:
-        # Only check sources not already marked stale
-        sources_with_paths = db.get_sources_with_paths(include_stale=False)
-    for source in sources_with_paths:
-        # Skip virtual paths (claude_ai stores claude_ai:uuid)
-        if source['source_type'] == 'claude_ai':
-            continue
-        if source['path'] and not Path(source['path']).exists():
-            newly_stale += 1
+        # Only check sources not already marked stale; skip virtual paths
+        # (claude_ai stores claude_ai:uuid)
+        sources_with_paths = db.get_sources_with_paths(
+            include_stale=False, exclude_types=('claude_ai',)
+        )
+    newly_stale = len(_missing_paths(sources_with_paths))
 
     if already_stale or newly_stale:
         click.echo(f"\nStale sources:")
@@ -84,7 +88,8 @@ def prune(dry_run, source_type, yes, hard_delete):
     """
     db = get_database()
     with db:
-        sources = db.get_sources_with_paths(source_type)
+        # Skip virtual paths (claude_ai stores claude_ai:uuid)
+        sources = db.get_sources_with_paths(source_type, exclude_types=('claude_ai',))
 
     if not sources:
         click.echo("No sources with filesystem paths found.")
@@ -94,16 +99,11 @@ def prune(dry_run, source_type, yes, hard_delete):
 
     # Group stale sources by type
     stale_by_type: dict[str, list[dict]] = {}
-    for source in sources:
-        # Skip virtual paths (claude_ai stores claude_ai:uuid)
-        if source['source_type'] == 'claude_ai':
-            continue
-
-        if source['path'] and not Path(source['path']).exists():
-            stype = source['source_type']
-            if stype not in stale_by_type:
-                stale_by_type[stype] = []
-            stale_by_type[stype].append(source)
+    for source in _missing_paths(sources):
+        stype = source['source_type']
+        if stype not in stale_by_type:
+            stale_by_type[stype] = []
+        stale_by_type[stype].append(source)
 
     if not stale_by_type:
         click.echo(click.style("All source paths are valid.", fg='green'))
@@ -192,9 +192,10 @@ def list_sources(ctx, source_type, limit):
         return
 
     click.echo(f"\n{len(rows)} sources:\n")
+    now = datetime.now(timezone.utc)
     for row in rows:
         title = row['title'][:55] if row['title'] else '(untitled)'
-        date_str = _format_date(row['updated_at'])
+        date_str = _format_date(row['updated_at'], now)
         click.echo(f"  [{row['source_type']}] {title}")
         click.echo(f"    {date_str} · {row['id']}")
 
@@ -246,18 +247,9 @@ def search(ctx, query, source_type, project_path, limit, recency_half_life):
     if project_path:
         if project_path == '.':
             # Use current git repo root
-            try:
-                result = subprocess.run(
-                    ['git', 'rev-parse', '--show-toplevel'],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    resolved_project = result.stdout.strip()
-                else:
-                    click.echo("Error: Not in a git repository. Use explicit path instead of '.'")
-                    return
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                click.echo("Error: Could not determine git root")
+            resolved_project = _resolve_git_root(os.getcwd())
+            if resolved_project is None:
+                click.echo("Error: Not in a git repository. Use explicit path instead of '.'")
                 return
         else:
             # Expand ~ and resolve path
@@ -270,11 +262,12 @@ def search(ctx, query, source_type, project_path, limit, recency_half_life):
     try:
         with db:
             results = db.search(expanded, source_type=source_type, project_path=resolved_project, limit=limit, recency_half_life=recency_half_life)
+            # One query for every result's extraction (the "unfolding label")
+            extractions = db.get_extractions([r.source_id for r in results])
     except Exception as e:
         if 'no such column' in str(e):
             # FTS5 interprets hyphens as MINUS operator (shouldn't happen with auto-quote, but keep as fallback)
-            import re
-            hyphenated = re.findall(r'\b\w+-\w+\b', expanded)
+            hyphenated = HYPHENATED_TERM_PATTERN.findall(expanded)
             if hyphenated:
                 suggested = expanded
                 for term in hyphenated:
@@ -289,14 +282,15 @@ def search(ctx, query, source_type, project_path, limit, recency_half_life):
         return
 
     click.echo(f"\n{len(results)} results:\n")
+    now = datetime.now(timezone.utc)
     for i, r in enumerate(results, 1):
         # Format date as relative or absolute
-        date_str = _format_date(r.created_at)
+        date_str = _format_date(r.created_at, now)
 
         click.echo(f"{i}. [{r.source_type}] {r.title[:60]}")
 
         # Check for hybrid extraction (the "unfolding label")
-        extraction = db.get_extraction(r.source_id)
+        extraction = extractions.get(r.source_id)
         if extraction and extraction.get('summary'):
             # Show extraction summary (more useful than raw text)
             click.echo(f"   {extraction['summary']}")
@@ -353,15 +347,22 @@ def files(ctx, query, limit):
     click.echo(f"\n{len(results)} results:\n")
 
     # Group by source for cleaner output
-    by_source = defaultdict(list)
+    # Source columns repeat on every row, so keep the first row per source
+    by_source = {}
     source_meta = {}
     for r in results:
-        by_source[r['source_id']].append(r['file_path'])
-        source_meta[r['source_id']] = r
+        source_id = r['source_id']
+        file_list = by_source.get(source_id)
+        if file_list is None:
+            by_source[source_id] = [r['file_path']]
+            source_meta[source_id] = r
+        else:
+            file_list.append(r['file_path'])
 
+    now = datetime.now(timezone.utc)
     for source_id, file_list in by_source.items():
         meta = source_meta[source_id]
-        date_str = _format_date(meta['created_at']) if meta['created_at'] else ''
+        date_str = _format_date(meta['created_at'], now) if meta['created_at'] else ''
         title = meta['title'][:50] if meta['title'] else '(untitled)'
 
         click.echo(f"[{meta['source_type']}] {title}")
@@ -386,9 +387,10 @@ def backfill_files(ctx, dry_run):
     with db:
         conn = db.connect()
 
-        # Get sources with extractions that have files_touched
+        # Get sources with extractions that have files_touched; SQLite pulls
+        # the list out so Python only parses that, not the whole metadata blob
         rows = conn.execute("""
-            SELECT s.id, s.metadata
+            SELECT s.id, json_extract(s.metadata, '$.files_touched') AS files_json
             FROM sources s
             WHERE s.metadata IS NOT NULL
               AND json_extract(s.metadata, '$.files_touched') IS NOT NULL
@@ -398,20 +400,19 @@ def backfill_files(ctx, dry_run):
             click.echo("No sources with files_touched metadata found.")
             return
 
-        total_files = 0
         sources_processed = 0
+        # (source_id, file_path) pairs for every source, inserted in one commit
+        mentions = []
 
         for row in rows:
             source_id = row['id']
             try:
-                metadata = json.loads(row['metadata']) if row['metadata'] else {}
-                file_list = metadata.get('files_touched', [])
+                file_list = json.loads(row['files_json']) if row['files_json'] else []
                 if file_list:
                     if dry_run:
                         click.echo(f"{source_id}: {len(file_list)} files")
                     else:
-                        added = db.add_file_mentions_batch(source_id, file_list)
-                        total_files += added
+                        mentions.extend((source_id, f) for f in file_list)
                     sources_processed += 1
             except (json.JSONDecodeError, TypeError):
                 continue
@@ -419,9 +420,20 @@ def backfill_files(ctx, dry_run):
         if dry_run:
             click.echo(f"\nDry run: would process {sources_processed} sources")
         else:
+            total_files = db.add_file_mentions_bulk(mentions)
             click.echo(f"Added files from {sources_processed} sources ({total_files} file mentions)")
 
 
+def _claude_ai_message_text(msg: dict) -> str:
+    """Message text, falling back to the first text content block."""
+    text = msg.get('text', '')
+    if not text:
+        for block in msg.get('content', []):
+            if isinstance(block, dict) and block.get('type') == 'text':
+                return block.get('text', '')
+    return text
+
+
 @main.command()
 @click.argument('source_id')
 @click.option('--full', is_flag=True, help='Show full content (not just summary)')
@@ -438,8 +450,17 @@ def drill(ctx, source_id, full, outline, turn):
       drill ID --full    → all turns (truncated to 2000 chars each)
     """
     db = get_database()
+    # Read everything drill needs from the database on one connection
     with db:
         source = db.get_source(source_id)
+        # The extraction is the "unfolding label"; the summary is its fallback
+        extraction = db.get_extraction(source_id) if source else None
+        summary_row = None
+        if source and not full and not (extraction and extraction.get('summary')):
+            summary_row = db.connect().execute(
+                "SELECT summary_text FROM summaries WHERE source_id = ?",
+                (source_id,)
+            ).fetchone()
 
     if not source:
         click.echo(f"Source not found: {source_id}")
@@ -451,9 +472,6 @@ def drill(ctx, source_id, full, outline, turn):
     click.echo(f"Path: {source['path']}")
 
     # Show extraction if available (the "unfolding label")
-    with db:
-        extraction = db.get_extraction(source_id)
-
     if extraction and extraction.get('summary'):
         click.echo(f"\n--- Extraction ---")
         click.echo(f"Summary: {extraction['summary']}")
@@ -497,15 +515,10 @@ def drill(ctx, source_id, full, outline, turn):
         click.echo(f"\n[Extracted with {extraction.get('model_used', 'unknown')} at {(extraction.get('extracted_at') or 'unknown')[:10]}]")
     elif not full:
         # Fallback to raw summary
-        with db:
-            row = db.connect().execute(
-                "SELECT summary_text FROM summaries WHERE source_id = ?",
-                (source_id,)
-            ).fetchone()
-            if row and row[0]:
-                click.echo(f"\nSummary:\n{row[0]}")
-            else:
-                click.echo("\n(No summary indexed)")
+        if summary_row and summary_row[0]:
+            click.echo(f"\nSummary:\n{summary_row[0]}")
+        else:
+            click.echo("\n(No summary indexed)")
 
     # Handle content display modes: --outline, --turn, --full
     if (full or outline or turn) and source['path']:
@@ -533,42 +546,33 @@ def drill(ctx, source_id, full, outline, turn):
             click.echo(path.read_text())
             return
 
-        # Load messages based on source type
-        messages = []  # List of (role, content) tuples
+        # Load messages based on source type: list of (role, content) tuples
         if source_type == 'claude_ai':
             from ..adapters.claude_ai import ClaudeAISource
             conv = ClaudeAISource.from_file(path)
-            for msg in conv.messages:
-                sender = msg.get('sender', 'unknown').upper()
-                text = msg.get('text', '')
-                if not text:
-                    for block in msg.get('content', []):
-                        if isinstance(block, dict) and block.get('type') == 'text':
-                            text = block.get('text', '')
-                            break
-                if text:
-                    messages.append((sender, text))
+            messages = [
+                (msg.get('sender', 'unknown').upper(), text)
+                for msg in conv.messages
+                if (text := _claude_ai_message_text(msg))
+            ]
 
         elif source_type == 'cloud_session':
             from ..adapters.cloud_sessions import CloudSessionSource
             conv = CloudSessionSource.from_file(path)
-            for msg in conv.messages:
-                role = msg.get('role', 'unknown').upper()
-                content = msg.get('content', '')
-                if isinstance(content, str) and content:
-                    messages.append((role, content))
+            messages = [
+                (msg.get('role', 'unknown').upper(), content)
+                for msg in conv.messages
+                if isinstance(content := msg.get('content', ''), str) and content
+            ]
 
         elif source_type == 'claude_code':
             from ..adapters.claude_code import ClaudeCodeSource
             conv = ClaudeCodeSource.from_file(path)
-            for turn in conv._build_turns():
-                if turn['role'] == 'system':
-                    continue
-                role = turn['role'].upper()
-                if role == 'HUMAN':
-                    role = 'USER'
-                if turn['text']:
-                    messages.append((role, turn['text']))
+            messages = [
+                ('USER' if t['role'].upper() == 'HUMAN' else t['role'].upper(), t['text'])
+                for t in conv._build_turns()
+                if t['role'] != 'system' and t['text']
+            ]
 
         else:
             click.echo(f"Unknown source type: {source_type}")
@@ -578,11 +582,14 @@ def drill(ctx, source_id, full, outline, turn):
         if outline:
             # Show numbered index with snippets
             click.echo(f"\n--- Outline ({len(messages)} turns) ---\n")
+            # Buffered: one write for the whole index, not one per turn
+            out = _EchoBuffer()
             for i, (role, content) in enumerate(messages, 1):
                 snippet = content[:100].replace('\n', ' ')
                 if len(content) > 100:
                     snippet += '...'
-                click.echo(f"  {i:3d}. [{role}] {snippet}")
+                out.echo(f"  {i:3d}. [{role}] {snippet}")
+            out.flush()
             click.echo(f"\nUse --turn N to see a specific turn in full")
 
         elif turn:
@@ -597,10 +604,12 @@ def drill(ctx, source_id, full, outline, turn):
         elif full:
             # Show all turns (truncated)
             click.echo(f"\n{'='*60}\n")
+            out = _EchoBuffer()
             for i, (role, content) in enumerate(messages, 1):
-                click.echo(f"\n[{role}] (turn {i})\n{content[:2000]}")
+                out.echo(f"\n[{role}] (turn {i})\n{content[:2000]}")
                 if len(content) > 2000:
-                    click.echo(f"... (showing 2000 of {len(content)} chars)")
+                    out.echo(f"... (showing 2000 of {len(content)} chars)")
+            out.flush()
 
 
 @main.command()
@@ -628,29 +637,35 @@ def recent(ctx, days, show_all, source_type, group_by_project):
     # Detect current project if not --all
     project_filter = None
     if not show_all:
-        try:
-            result = subprocess.run(
-                ['git', 'rev-parse', '--show-toplevel'],
-                capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                repo_path = result.stdout.strip()
-                # Convert /Users/jane/Repos/foo to -Users-jane-Repos-foo
-                project_filter = repo_path.replace('/', '-').lstrip('-')
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+        repo_path = _resolve_git_root(os.getcwd())
+        if repo_path is not None:
+            # Convert /Users/jane/Repos/foo to -Users-jane-Repos-foo
+            project_filter = repo_path.replace('/', '-').lstrip('-')
+            # Claude Code's own encoding of the cwd ('_', '.' etc. become '-')
+            project_prefix = encode_cwd(repo_path)
+
+    # One clock reading for the cutoff and the day labels
+    now = datetime.now(timezone.utc)
 
     # Calculate cutoff date
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    cutoff = now - timedelta(days=days)
     cutoff_str = cutoff.isoformat()
 
     with db:
         conn = db.connect()
 
-        # Build query
+        # Build query. The display title (falling back to the extraction
+        # summary for untitled sources) and the day key are computed here.
         sql = """
-            SELECT s.id, s.source_type, s.title, s.updated_at, s.project_path
+            SELECT s.id, s.source_type, s.title, s.updated_at, s.project_path,
+                   CASE
+                       WHEN s.title != '' AND s.title != '(untitled)' THEN substr(s.title, 1, 55)
+                       WHEN e.summary != '' THEN substr(e.summary, 1, 55) || '...'
+                       ELSE '(untitled)'
+                   END AS display_title,
+                   COALESCE(date(substr(s.updated_at, 1, 10)), 'unknown') AS day_key
             FROM sources s
+            LEFT JOIN extractions e ON e.source_id = s.id
             WHERE s.updated_at >= ?
         """
         params = [cutoff_str]
@@ -668,8 +683,20 @@ def recent(ctx, days, show_all, source_type, group_by_project):
             else:
                 # For non-Repos paths, take last segment (e.g., "-Users-jane-foo" → "foo")
                 repo_name = project_filter.rsplit('-', 1)[-1]
-            sql += " AND (s.project_path LIKE ? OR (s.source_type = 'handoff' AND (s.title LIKE ? OR s.id LIKE ?)))"
-            params.append(f"%{project_filter}%")
+            # Claude Code project_path is the encoded cwd ("-Users-jane-Repos-project",
+            # or longer for subdirectories): a prefix range the NOCASE index can
+            # seek, case-insensitive like the LIKE it replaced (macOS paths may
+            # differ in case). Handoffs come from the source_type index; a plain
+            # OR would scan.
+            sql += """ AND s.id IN (
+                SELECT id FROM sources
+                WHERE project_path COLLATE NOCASE >= ? AND project_path COLLATE NOCASE < ?
+                UNION
+                SELECT id FROM sources
+                WHERE source_type = 'handoff' AND (title LIKE ? OR id LIKE ?)
+            )"""
+            params.append(project_prefix)
+            params.append(project_prefix + '\U0010ffff')
             params.append(f"%{repo_name}%")
             params.append(f"%{repo_name}%")
 
@@ -686,8 +713,9 @@ def recent(ctx, days, show_all, source_type, group_by_project):
         return
 
     # Helper to extract project name from project_path
+    # Rows come from the query above, so every column is present
     def get_project_name(row):
-        path = row['project_path'] or '' if 'project_path' in row.keys() else ''
+        path = row['project_path'] or ''
         # project_path looks like "-Users-jane-Repos-project" or similar
         if '-Repos-' in path:
             return path.split('-Repos-')[-1]
@@ -695,44 +723,13 @@ def recent(ctx, days, show_all, source_type, group_by_project):
             # For non-Repos paths, take last segment
             return path.rsplit('-', 1)[-1] if '-' in path else path
         # Fallback: try to extract from source_id or title
-        st = row['source_type'] if 'source_type' in row.keys() else ''
-        if 'handoff' in st:
+        if 'handoff' in row['source_type']:
             # Handoffs have project in title usually
-            title = row['title'] if 'title' in row.keys() else ''
+            title = row['title']
             if title:
                 return title.split()[0] if title else '(unknown)'
         return '(unknown)'
 
-    # Batch prefetch extractions for rows that might need fallback titles
-    # (Avoids N+1 queries in get_display_title)
-    extraction_cache = {}
-    rows_needing_extraction = [
-        row['id'] for row in rows
-        if not row['title'] or row['title'] == '(untitled)'
-    ]
-    if rows_needing_extraction:
-        with db:
-            conn = db.connect()
-            placeholders = ','.join('?' * len(rows_needing_extraction))
-            extractions = conn.execute(
-                f"SELECT source_id, summary FROM extractions WHERE source_id IN ({placeholders})",
-                rows_needing_extraction
-            ).fetchall()
-            for ext in extractions:
-                if ext['summary']:
-                    extraction_cache[ext['source_id']] = ext['summary'][:55] + '...'
-
-    # Helper to get display title (with extraction fallback)
-    def get_display_title(row):
-        title = row['title'] if 'title' in row.keys() else None
-        if title and title != '(untitled)':
-            return title[:55]
-        # Try extraction summary as fallback (already prefetched)
-        source_id = row['id'] if 'id' in row.keys() else None
-        if source_id and extraction_cache.get(source_id):
-            return extraction_cache[source_id]
-        return '(untitled)'
-
     if group_by_project:
         # Group by project
         by_project = defaultdict(list)
@@ -751,8 +748,7 @@ def recent(ctx, days, show_all, source_type, group_by_project):
 
             # Show up to 3 session titles as preview
             for row in sessions[:3]:
-                title = get_display_title(row)
-                click.echo(f"  · {title}")
+                click.echo(f"  · {row['display_title']}")
             if len(sessions) > 3:
                 click.echo(f"  · ... and {len(sessions) - 3} more")
             click.echo()
@@ -760,27 +756,14 @@ def recent(ctx, days, show_all, source_type, group_by_project):
         # Group by day (original behavior)
         by_day = defaultdict(list)
         for row in rows:
-            updated = row['updated_at']
-            if updated:
-                # Parse and extract date part
-                try:
-                    if 'T' in updated:
-                        dt = datetime.fromisoformat(updated.replace('Z', '+00:00'))
-                    else:
-                        dt = datetime.fromisoformat(updated)
-                    day_key = dt.strftime('%Y-%m-%d')
-                    by_day[day_key].append(row)
-                except ValueError:
-                    by_day['unknown'].append(row)
-            else:
-                by_day['unknown'].append(row)
+            by_day[row['day_key']].append(row)
 
         # Format output
         scope = "current project" if project_filter else "all sources"
         click.echo(f"\n{len(rows)} sources ({scope}, last {days} days):\n")
 
-        today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-        yesterday = (datetime.now(timezone.utc) - timedelta(days=1)).strftime('%Y-%m-%d')
+        today = now.strftime('%Y-%m-%d')
+        yesterday = (now - timedelta(days=1)).strftime('%Y-%m-%d')
 
         for day in sorted(by_day.keys(), reverse=True):
             # Format day header
@@ -800,8 +783,6 @@ def recent(ctx, days, show_all, source_type, group_by_project):
             click.echo(f"{day_label}:")
 
             for row in by_day[day]:
-                title = get_display_title(row)
-                stype = row['source_type']
-                click.echo(f"  [{stype}] {title}")
+                click.echo(f"  [{row['source_type']}] {row['display_title']}")
 
             click.echo()
@@ -1,5 +1,7 @@
 """Entity resolution and glossary commands."""
 
+from collections import defaultdict
+
 import click
 
 from ..database import get_database
@@ -96,17 +98,25 @@ def glossary_check(ctx):
     glossary = ctx.obj['glossary']
     issues_found = False
 
+    # Lowercase every key, name and alias once for both checks below
+    lowered = {
+        key: (
+            key.lower(),
+            entity.get('name', ''),
+            entity.get('name', '').lower(),
+            [a.lower() for a in entity.get('aliases', [])],
+        )
+        for key, entity in glossary.entities.items()
+    }
+
     # Check 1: Key differs from name and key not in aliases
     click.echo("Checking key/name alignment...")
     key_issues = []
-    for key, entity in glossary.entities.items():
-        name = entity.get('name', '')
-        aliases = [a.lower() for a in entity.get('aliases', [])]
-
+    for key, (key_lower, name, name_lower, aliases) in lowered.items():
         # Key differs from name (case-insensitive)
-        if key.lower() != name.lower():
+        if key_lower != name_lower:
             # Key not in aliases
-            if key.lower() not in aliases:
+            if key_lower not in aliases:
                 key_issues.append((key, name, aliases[:3]))
 
     if key_issues:
@@ -121,21 +131,18 @@ def glossary_check(ctx):
 
     # Check 2: Duplicate aliases across entities
     click.echo("\nChecking for duplicate aliases...")
-    alias_to_entities: dict[str, list[str]] = {}
-
-    for key, entity in glossary.entities.items():
-        # Collect all terms this entity claims (dedupe within entity)
-        terms = set()
-        terms.add(key.lower())  # Key itself
-        name = entity.get('name', '')
-        if name:
-            terms.add(name.lower())
-        for alias in entity.get('aliases', []):
-            terms.add(alias.lower())
+    alias_to_entities: dict[str, list[str]] = defaultdict(list)
+
+    for key, (key_lower, _, name_lower, aliases) in lowered.items():
+        # Collect all terms this entity claims (dedupe within entity):
+        # the key itself, the name and the aliases
+        terms = {key_lower, *aliases}
+        if name_lower:
+            terms.add(name_lower)
 
         # Add each unique term to the index
         for term in terms:
-            alias_to_entities.setdefault(term, []).append(key)
+            alias_to_entities[term].append(key)
 
     duplicates = {alias: keys for alias, keys in alias_to_entities.items() if len(keys) > 1}
 
@@ -1,6 +1,8 @@
 """Extraction commands — LLM-powered extraction and backfill."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 
 import click
 
@@ -66,31 +68,57 @@ def extract(ctx, source_id, dry_run):
         if result.entities:
             click.echo("\nEntities found:")
             for e in result.entities:
-                status = "matched" if glossary.resolve(e['mention']) else "pending"
+                status = "matched" if e.get('matched') else "pending"
                 suggested = f" → {e.get('suggested_canonical')}" if e.get('suggested_canonical') else ""
                 click.echo(f"  [{e.get('confidence', '?')}] {e['mention']}{suggested} ({status})")
 
 
+def _backfill_extract(row, summary_text: str | None) -> dict | None:
+    """Load a source's text and run hybrid extraction; None if it's too short.
+
+    Runs on a backfill worker thread, so it must not touch the database:
+    non-claude_code text arrives as summary_text, read beforehand.
+    """
+    from ..llm import extract_hybrid
+    from ..adapters.claude_code import ClaudeCodeSource
+
+    # Load source to get full text and messages (for semantic chunking)
+    messages = None  # Only available for claude_code sources
+    if row['source_type'] == 'claude_code':
+        source = ClaudeCodeSource.from_file(Path(row['path']))
+        full_text = source.full_text()
+        messages = source.messages_with_offsets()
+    else:
+        full_text = summary_text
+
+    if not full_text or len(full_text) < 100:
+        return None
+
+    # Run hybrid extraction (uses semantic chunking if messages available)
+    return extract_hybrid(full_text, messages=messages)
+
+
 @main.command()
 @click.option('--limit', '-n', default=10, help='Maximum sources to process')
 @click.option('--source-type', type=str, help='Only process this source type')
 @click.option('--skip-short', is_flag=True, help='Mark sources with <100 chars as skipped instead of processing')
+@click.option('--parallel', '-j', default=4, show_default=True, help='Sources to extract concurrently')
 @click.option('--dry-run', is_flag=True, help='Show what would be processed')
 @click.pass_context
-def backfill(ctx, limit, source_type, skip_short, dry_run):
+def backfill(ctx, limit, source_type, skip_short, parallel, dry_run):
     """Backfill hybrid extractions for existing sources.
 
     Finds sources without extractions and runs hybrid extraction on them.
     Uses claude -p (Opus 4.6 via Max subscription) for all extractions.
     Use --limit to control batch size (default 10).
     Use --skip-short to mark sources with insufficient content as skipped.
+    Use --parallel to set how many LLM extractions run at once (default 4).
 
     Example:
         garde backfill --limit 50 --source-type claude_code
         garde backfill --limit 500 --skip-short
     """
-    from ..llm import extract_hybrid, MODEL
-    from ..adapters.claude_code import ClaudeCodeSource
+    from ..llm import MODEL
 
     db = get_database()
     with db:
@@ -175,68 +203,71 @@ def backfill(ctx, limit, source_type, skip_short, dry_run):
         processed = 0
         failed = 0
 
-        for row in rows:
-            source_id = row['id']
-            source_type_val = row['source_type']
-            path = row['path']
-
-            click.echo(f"\nProcessing: {row['title'][:50]}...")
-
+        # extract_hybrid mostly waits on the LLM, so several run at once;
+        # only this thread touches the database
+        with ThreadPoolExecutor(max_workers=max(1, parallel)) as pool:
             try:
-                # Load source to get full text and messages (for semantic chunking)
-                messages = None  # Only available for claude_code sources
-                if source_type_val == 'claude_code':
-                    from pathlib import Path as PathLib
-                    source = ClaudeCodeSource.from_file(PathLib(path))
-                    full_text = source.full_text()
-                    messages = source.messages_with_offsets()
-                else:
-                    # For other types, try to get from summaries table
-                    summary_row = conn.execute(
-                        "SELECT summary_text FROM summaries WHERE source_id = ?",
-                        (source_id,)
-                    ).fetchone()
-                    if summary_row:
-                        full_text = summary_row['summary_text']
-                    else:
-                        if skip_short:
-                            db.upsert_extraction(source_id=source_id, model_used='skipped:no_content')
-                            click.echo(f"  Marked skipped: no content")
-                        else:
-                            click.echo(f"  Skipping: no content available")
-                        continue
-
-                if not full_text or len(full_text) < 100:
-                    if skip_short:
-                        db.upsert_extraction(source_id=source_id, model_used='skipped:content_too_short')
-                        click.echo(f"  Marked skipped: content too short")
-                    else:
-                        click.echo(f"  Skipping: content too short")
-                    continue
-
-                # Run hybrid extraction (uses semantic chunking if messages available)
-                hybrid_result = extract_hybrid(full_text, messages=messages)
-
-                db.upsert_extraction(
-                    source_id=source_id,
-                    summary=hybrid_result.get('summary'),
-                    arc=hybrid_result.get('arc'),
-                    builds=hybrid_result.get('builds'),
-                    learnings=hybrid_result.get('learnings'),
-                    friction=hybrid_result.get('friction'),
-                    patterns=hybrid_result.get('patterns'),
-                    open_threads=hybrid_result.get('open_threads'),
-                    model_used=MODEL,
-                )
-
-                builds_count = len(hybrid_result.get('builds', []))
-                learnings_count = len(hybrid_result.get('learnings', []))
-                click.echo(f"  {builds_count} builds, {learnings_count} learnings")
-                processed += 1
-
-            except Exception as e:
-                click.echo(f"  Error: {e}")
-                failed += 1
+                futures = {}
+                for row in rows:
+                    summary_text = None
+                    if row['source_type'] != 'claude_code':
+                        # For other types, try to get from summaries table
+                        summary_row = conn.execute(
+                            "SELECT summary_text FROM summaries WHERE source_id = ?",
+                            (row['id'],)
+                        ).fetchone()
+                        if not summary_row:
+                            click.echo(f"\nProcessing: {row['title'][:50]}...")
+                            if skip_short:
+                                db.upsert_extraction(source_id=row['id'], model_used='skipped:no_content')
+                                click.echo(f"  Marked skipped: no content")
+                            else:
+                                click.echo(f"  Skipping: no content available")
+                            continue
+                        summary_text = summary_row['summary_text']
+                    futures[pool.submit(_backfill_extract, row, summary_text)] = row
+
+                for future in as_completed(futures):
+                    row = futures[future]
+                    source_id = row['id']
+
+                    click.echo(f"\nProcessing: {row['title'][:50]}...")
+
+                    try:
+                        hybrid_result = future.result()
+                        if hybrid_result is None:
+                            if skip_short:
+                                db.upsert_extraction(source_id=source_id, model_used='skipped:content_too_short')
+                                click.echo(f"  Marked skipped: content too short")
+                            else:
+                                click.echo(f"  Skipping: content too short")
+                            continue
+
+                        db.upsert_extraction(
+                            source_id=source_id,
+                            summary=hybrid_result.get('summary'),
+                            arc=hybrid_result.get('arc'),
+                            builds=hybrid_result.get('builds'),
+                            learnings=hybrid_result.get('learnings'),
+                            friction=hybrid_result.get('friction'),
+                            patterns=hybrid_result.get('patterns'),
+                            open_threads=hybrid_result.get('open_threads'),
+                            model_used=MODEL,
+                        )
+
+                        builds_count = len(hybrid_result.get('builds', []))
+                        learnings_count = len(hybrid_result.get('learnings', []))
+                        click.echo(f"  {builds_count} builds, {learnings_count} learnings")
+                        processed += 1
+
+                    except Exception as e:
+                        click.echo(f"  Error: {e}")
+                        failed += 1
+            except BaseException:
+                # Ctrl-C or an error: don't start the queued extractions
+                # (the with block still waits for those already running)
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
 
         click.echo(f"\nBackfill complete: {processed} processed, {failed} failed")
 
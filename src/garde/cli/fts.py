@@ -15,6 +15,9 @@ from . import main
 from ._helpers import _flatten_extraction_for_fts
 
 
+UPDATE_RAW_TEXT_SQL = "UPDATE summaries SET raw_text = ? WHERE source_id = ?"
+
+
 @main.command('sync-fts')
 @click.pass_context
 def sync_fts(ctx):
@@ -25,6 +28,7 @@ def sync_fts(ctx):
     including flattened learnings, builds, and friction.
     """
     db = get_database()
+    db.configure_for_writes()
     conn = db.connect()
 
     # Find all extractions
@@ -42,7 +46,8 @@ def sync_fts(ctx):
 
     click.echo(f"Checking {len(rows)} sources with extractions...")
 
-    updated = 0
+    # (rich_text, source_id) for every row whose FTS text changed
+    updates = []
     for row in rows:
         # Build rich searchable text
         extraction = {
@@ -55,14 +60,14 @@ def sync_fts(ctx):
 
         # Only update if different
         if row['summary_text'] != rich_text:
-            conn.execute("""
-                UPDATE summaries SET summary_text = ?
-                WHERE source_id = ?
-            """, (rich_text, row['source_id']))
-            updated += 1
+            updates.append((rich_text, row['source_id']))
 
+    conn.executemany("""
+        UPDATE summaries SET summary_text = ?
+        WHERE source_id = ?
+    """, updates)
     conn.commit()
-    click.echo(f"Updated {updated} FTS entries with rich extraction content.")
+    click.echo(f"Updated {len(updates)} FTS entries with rich extraction content.")
 
 
 @main.command('rebuild-fts')
@@ -76,6 +81,7 @@ def rebuild_fts(ctx):
     This also ensures raw_text is indexed for full-text search.
     """
     db = get_database()
+    db.configure_for_writes()
     conn = db.connect()
 
     click.echo("Dropping old FTS table and triggers...")
@@ -200,6 +206,7 @@ def populate_raw_text(ctx, batch_size, limit):
     loading source content on demand.
     """
     db = get_database()
+    db.configure_for_writes()
     conn = db.connect()
 
     # Find summaries missing raw_text
@@ -232,6 +239,8 @@ def populate_raw_text(ctx, batch_size, limit):
     updated = 0
     errors = 0
     config = ctx.obj or load_config()
+    # (raw_text, source_id) rows waiting for the next batch write
+    pending = []
 
     for i, row in enumerate(missing):
         source_id = row[0]
@@ -263,8 +272,7 @@ def populate_raw_text(ctx, batch_size, limit):
                 raw_text = source.full_text()
 
             elif source_type == 'cloud_session' and p and p.exists():
-                source = CloudSessionSource.from_file(p)
-                raw_text = source.full_text()
+                raw_text = CloudSessionSource.text_only(p, max_chars=100_000)
 
             elif source_type == 'local_md' and p and p.exists():
                 # LocalMdSource.from_file needs base_path; use parent as approximation
@@ -276,21 +284,22 @@ def populate_raw_text(ctx, batch_size, limit):
                 if len(raw_text) > 100_000:
                     raw_text = raw_text[:100_000]
 
-                conn.execute("""
-                    UPDATE summaries SET raw_text = ?
-                    WHERE source_id = ?
-                """, (raw_text, source_id))
+                pending.append((raw_text, source_id))
                 updated += 1
 
-                if updated % batch_size == 0:
-                    conn.commit()
-                    click.echo(f"  Progress: {updated}/{total} ({100*updated//total}%)")
-
         except Exception as e:
             errors += 1
             if errors <= 5:
                 click.echo(f"  Error on {source_id}: {e}")
+            continue
+
+        if len(pending) >= batch_size:
+            conn.executemany(UPDATE_RAW_TEXT_SQL, pending)
+            conn.commit()
+            pending.clear()
+            click.echo(f"  Progress: {updated}/{total} ({100*updated//total}%)")
 
+    conn.executemany(UPDATE_RAW_TEXT_SQL, pending)
     conn.commit()
 
     click.echo(f"Updated {updated} summaries with raw_text ({errors} errors)")
@@ -9,7 +9,7 @@ from ..config import encode_cwd
 from ..database import get_database
 from ..adapters.claude_code import ClaudeCodeSource
 from . import main
-from ._helpers import _create_basic_summary
+from ._helpers import _create_basic_summary, _flatten_extraction_for_fts
 
 
 @main.command()
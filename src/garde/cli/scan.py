@@ -1,8 +1,11 @@
 """Scan command — discover and index sources."""
 
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+
 import click
 
-from ..database import get_database
+from ..database import Database, get_database
 from ..adapters.claude_code import discover_claude_code, ClaudeCodeSource
 from ..adapters.claude_ai import discover_claude_ai, ClaudeAISource
 from ..adapters.cloud_sessions import discover_cloud_sessions, CloudSessionSource
@@ -11,14 +14,419 @@ from ..adapters.local_md import discover_local_md, LocalMdSource
 from ..adapters.bon import discover_bon, BonSource
 from ..adapters.knowledge import discover_knowledge, KnowledgeSource
 from ..adapters.amp import discover_amp, AmpSource
+from ..adapters._discovery import parse_parallel, prefetch
 from . import main
-from ._helpers import _create_basic_summary, _flatten_extraction_for_fts
+from ._helpers import _EchoBuffer, _create_basic_summary, _flatten_extraction_for_fts
+
+
+# Sources and summaries queued per executemany in a scan
+ROW_BATCH_SIZE = 200
+
+
+class _RowBatch:
+    """Source and summary rows queued for the database's batch upserts.
+
+    Rows are upsert_source()/upsert_summary() keyword dicts. A flush
+    writes the sources first, so summaries can look up their titles.
+    """
+
+    def __init__(self, db: Database, flush_every: int | None = None):
+        self.db = db
+        self.flush_every = flush_every or ROW_BATCH_SIZE
+        self._sources: list[dict] = []
+        self._summaries: list[dict] = []
+
+    def source(self, **row) -> None:
+        self._sources.append(row)
+        if len(self._sources) >= self.flush_every:
+            self.flush()
+
+    def summary(self, **row) -> None:
+        self._summaries.append(row)
+
+    def __enter__(self) -> '_RowBatch':
+        return self
+
+    def __exit__(self, *args) -> None:
+        # Also on error, so rows queued before a failure are kept
+        self.flush()
+
+    def flush(self) -> None:
+        if self._sources:
+            self.db.upsert_sources_batch(self._sources)
+            self._sources.clear()
+        if self._summaries:
+            self.db.upsert_summaries_batch(self._summaries)
+            self._summaries.clear()
+
+
+# Store functions queue one discovered source's rows. They return True if
+# a structured extraction was stored too (counted in the scan totals).
+# Marking sources processed is left to _scan_adapter, which batches it.
+
+def _store_claude_code(rows: _RowBatch, source: ClaudeCodeSource, change_key: str | None) -> bool:
+    # Store source metadata
+    rows.source(
+        source_id=source.source_id,
+        source_type='claude_code',
+        title=source.title,
+        path=str(source.path),
+        created_at=source.created_at,
+        updated_at=source.updated_at,
+        is_subagent=source.is_subagent,
+        project_path=source.project_path,
+        metadata=source.metadata,
+    )
+
+    # Create summary (use presummary if available, else basic extraction)
+    summary = source.summary_text or _create_basic_summary(source)
+    rows.summary(
+        source_id=source.source_id,
+        summary_text=summary,
+        has_presummary=source.has_presummary,
+        raw_text=source.full_text(),
+    )
+    return False
+
+
+def _store_claude_ai(rows: _RowBatch, source: ClaudeAISource, change_key: str | None) -> bool:
+    # Store source metadata
+    rows.source(
+        source_id=source.source_id,
+        source_type='claude_ai',
+        title=source.name,
+        path=f"claude_ai:{source.uuid}",  # Virtual path using UUID
+        created_at=source.created_at,
+        updated_at=source.updated_at,
+    )
+
+    # Use pre-generated summary (Claude.ai has these)
+    summary = source.summary if source.summary else source.name
+    rows.summary(
+        source_id=source.source_id,
+        summary_text=summary,
+        has_presummary=source.has_presummary,
+        raw_text=source.full_text(),
+    )
+    return False
+
+
+def _store_handoff(rows: _RowBatch, source: HandoffSource, change_key: str | None) -> bool:
+    # Store source metadata (include session_id for backfill dedup)
+    metadata = {'session_id': source.session_id} if source.session_id else None
+    rows.source(
+        source_id=source.source_id,
+        source_type='handoff',
+        title=source.title,
+        path=str(source.path),
+        created_at=source.date,
+        updated_at=source.date,
+        project_path=source.project_path,
+        content_hash=change_key,
+        metadata=metadata,
+    )
+
+    # Use full text as summary (handoffs are already distilled)
+    full_text = source.full_text()
+    rows.summary(
+        source_id=source.source_id,
+        summary_text=full_text,
+        has_presummary=True,
+        raw_text=full_text,
+    )
+
+    # Extract structured fields from handoff sections (free, no LLM)
+    extraction = source.to_extraction()
+    if extraction:
+        # upsert_extraction updates the summary row, so write it first
+        rows.flush()
+        rows.db.upsert_extraction(
+            source_id=source.source_id,
+            summary=extraction.get('summary'),
+            arc=extraction.get('arc'),
+            builds=extraction.get('builds'),
+            learnings=extraction.get('learnings'),
+            friction=extraction.get('friction'),
+            patterns=extraction.get('patterns'),
+            open_threads=extraction.get('open_threads'),
+            model_used='handoff-section-parse',
+        )
+        # Sync to FTS for searchability
+        rich_text = _flatten_extraction_for_fts(extraction)
+        if rich_text:
+            rows.summary(
+                source_id=source.source_id,
+                summary_text=rich_text,
+                has_presummary=True,
+                raw_text=full_text,
+            )
+
+    return bool(extraction)
+
+
+def _store_cloud_session(rows: _RowBatch, source: CloudSessionSource, change_key: str | None) -> bool:
+    # Store source metadata
+    rows.source(
+        source_id=source.source_id,
+        source_type='cloud_session',
+        title=source.title,
+        path=str(source.path),
+        created_at=source.created_at,
+        updated_at=source.updated_at,
+        metadata=source.metadata,
+    )
+
+    # Use summary if available, else full text
+    full_text = source.full_text()
+    summary = source.summary_text if source.summary_text else full_text[:500]
+    rows.summary(
+        source_id=source.source_id,
+        summary_text=summary,
+        has_presummary=source.has_presummary,
+        raw_text=full_text,
+    )
+    return False
+
+
+def _store_local_md(rows: _RowBatch, source: LocalMdSource, change_key: str | None) -> bool:
+    # Store source metadata with mtime for change detection
+    rows.source(
+        source_id=source.source_id,
+        source_type='local_md',
+        title=source.title,
+        path=str(source.path),
+        created_at=source.date,
+        updated_at=source.date,
+        project_path=source.project_path,
+        content_hash=change_key,
+    )
+
+    # Index full content (no LLM summarization)
+    # For local_md, summary_text = raw_text (both are full content)
+    full_text = source.full_text()
+    rows.summary(
+        source_id=source.source_id,
+        summary_text=full_text,
+        has_presummary=False,
+        raw_text=full_text,
+    )
+    return False
+
+
+def _store_bon(rows: _RowBatch, source: BonSource, change_key: str | None) -> bool:
+    rows.source(
+        source_id=source.source_id,
+        source_type='bon',
+        title=source.title,
+        path=str(source.path),
+        created_at=source.created_at,
+        updated_at=source.done_at or source.created_at,
+        project_path=source.project_path,
+        content_hash=change_key,
+        metadata=source.metadata,
+    )
+
+    full_text = source.full_text()
+    rows.summary(
+        source_id=source.source_id,
+        summary_text=full_text,
+        has_presummary=True,
+        raw_text=full_text,
+    )
+    return False
+
+
+def _store_knowledge(rows: _RowBatch, source: KnowledgeSource, change_key: str | None) -> bool:
+    # Store source metadata with mtime for change detection
+    rows.source(
+        source_id=source.source_id,
+        source_type='knowledge',
+        title=source.title,
+        path=str(source.path),
+        created_at=source.date,
+        updated_at=source.date,
+        project_path=source.project_path,
+        content_hash=change_key,
+    )
+
+    # Index full content (knowledge is already distilled)
+    full_text = source.full_text()
+    rows.summary(
+        source_id=source.source_id,
+        summary_text=full_text,
+        has_presummary=True,
+        raw_text=full_text,
+    )
+    return False
+
+
+def _store_amp(rows: _RowBatch, source: AmpSource, change_key: str | None) -> bool:
+    rows.source(
+        source_id=source.source_id,
+        source_type='amp',
+        title=source.title,
+        path=str(source.path),
+        created_at=source.created_at,
+        updated_at=source.updated_at,
+        project_path=source.project_path,
+        content_hash=change_key,
+        metadata=source.metadata,
+    )
+
+    full_text = source.full_text()
+    if full_text:
+        rows.summary(
+            source_id=source.source_id,
+            summary_text=source.title,  # Placeholder until backfill or amp-close extracts
+            has_presummary=False,  # Needs LLM extraction — title is NOT a real summary
+            raw_text=full_text,
+        )
+    return False
+
+
+def _mtime_key(source: Any) -> str:
+    return str(source.mtime)
+
+
+def _bon_change_key(source: BonSource) -> str:
+    # Use done_at for change detection (items change when completed)
+    created_at_str = source.created_at.isoformat() if source.created_at else ''
+    return f"{created_at_str}:{source.status}"
+
+
+def _amp_change_key(source: AmpSource) -> str:
+    # Use updated_at for change detection (new messages update this)
+    return source.updated_at.isoformat()
+
+
+@dataclass(frozen=True)
+class AdapterSpec:
+    """How scan discovers, change-checks, stores and reports one source kind."""
+    name: str                 # --source choice
+    heading: str              # "Scanning {heading}..."
+    label: str                # Name in the totals
+    dry_run_label: str        # Name in the dry-run totals
+    source_type: str
+    discover: Callable[[dict], Iterator[Any]]
+    store: Callable[[_RowBatch, Any, str | None], bool]
+    # None: no change detection, the source is re-stored on every scan
+    change_key: Callable[[Any], str] | None = None
+    use_name_as_title: bool = False   # Claude.ai conversations have .name
+    title_suffix: str = '...'
+    limit_output: bool = False        # Only echo the first 10 new sources
+    reports_extracted: bool = False
+    marks_processed: bool = True      # Amp threads stay pending for extraction
+    reads_lazily: bool = False        # Sources read their file on load()
+
+
+ADAPTERS = [
+    AdapterSpec('claude_code', 'Claude Code conversations', 'Claude Code', 'Claude Code',
+                'claude_code', discover_claude_code, _store_claude_code),
+    AdapterSpec('claude_ai', 'Claude.ai conversations', 'Claude.ai', 'Claude.ai',
+                'claude_ai', discover_claude_ai, _store_claude_ai,
+                use_name_as_title=True),
+    AdapterSpec('handoffs', 'handoff files', 'Handoffs', 'handoffs',
+                'handoff', discover_handoffs, _store_handoff,
+                change_key=_mtime_key, reports_extracted=True),
+    AdapterSpec('cloud_sessions', 'cloud sessions', 'Cloud sessions', 'cloud',
+                'cloud_session', discover_cloud_sessions, _store_cloud_session),
+    AdapterSpec('local_md', 'local markdown files', 'Local markdown', 'local_md',
+                'local_md', discover_local_md, _store_local_md,
+                change_key=_mtime_key, limit_output=True, reads_lazily=True),
+    AdapterSpec('bon', 'bon', 'Bon', 'bon',
+                'bon', discover_bon, _store_bon,
+                change_key=_bon_change_key),
+    AdapterSpec('knowledge', 'knowledge articles', 'Knowledge', 'knowledge',
+                'knowledge', discover_knowledge, _store_knowledge,
+                change_key=_mtime_key, limit_output=True, reads_lazily=True),
+    AdapterSpec('amp', 'Amp threads', 'Amp', 'amp',
+                'amp', discover_amp, _store_amp,
+                change_key=_amp_change_key, title_suffix='', marks_processed=False),
+]
+
+
+def _read_changed(
+    spec: AdapterSpec, sources: Iterator[Any], known: dict,
+) -> Iterator[tuple[Any, Exception | None]]:
+    """Read changed sources' files on the parse pool, ahead of the scan loop.
+
+    Yields (source, read error). Unchanged sources are passed through
+    unread, so they stay cheap to skip.
+    """
+    def read(source):
+        change_key = spec.change_key(source) if spec.change_key else None
+        if change_key is None or known.get(source.source_id) != change_key:
+            source.load()
+
+    for source, _, error in parse_parallel(read, sources):
+        yield source, error
+
+
+def _scan_adapter(
+    spec: AdapterSpec,
+    sources: Iterator[Any],
+    db: Database,
+    dry_run: bool,
+    out: _EchoBuffer,
+) -> dict[str, int]:
+    """Store the new and changed sources of one kind; return its counts."""
+    counts = {'new': 0, 'updated': 0, 'skipped': 0, 'extracted': 0}
+    known = db.get_existing_hashes(spec.source_type)
+    processed = []  # Marked in one batch once the adapter is done
+    with _RowBatch(db) as rows:
+        if spec.reads_lazily:
+            loaded = _read_changed(spec, sources, known)
+        else:
+            loaded = ((source, None) for source in sources)
+
+        for source, read_error in loaded:
+            exists = source.source_id in known
+            change_key = spec.change_key(source) if spec.change_key else None
+
+            if change_key is not None and exists and known[source.source_id] == change_key:
+                # Unchanged since last scan, skip processing
+                counts['skipped'] += 1
+                continue
+
+            if read_error is None:
+                try:
+                    title = source.name if spec.use_name_as_title else source.title
+                except OSError as e:
+                    # A lazy source the pool didn't read opens its file here
+                    read_error = e
+            if read_error is not None:
+                click.echo(f"  Failed to read {source.source_id}: {read_error}", err=True)
+                continue
+            if dry_run:
+                status = "exists" if exists else "new"
+                out.echo(f"  [{status}] {source.source_id}: {title[:60]}{spec.title_suffix}")
+                if not exists:
+                    counts['new'] += 1
+                continue
+
+            if spec.store(rows, source, change_key):
+                counts['extracted'] += 1
+            if spec.marks_processed:
+                processed.append(source.source_id)
+
+            known[source.source_id] = change_key
+            if exists:
+                counts['updated'] += 1
+            else:
+                counts['new'] += 1
+                if not spec.limit_output or counts['new'] <= 10:
+                    out.echo(f"  + {title[:70]}{spec.title_suffix}")
+                elif counts['new'] == 11:  # Limit output for large scans
+                    out.echo(f"  ... (limiting output)")
+
+    db.mark_processed_batch(processed)
+    return counts
 
 
 @main.command()
 @click.option('--dry-run', is_flag=True, help="Show what would be indexed without storing")
 @click.option('--source', 'source_filter',
-              type=click.Choice(['claude_code', 'claude_ai', 'handoffs', 'cloud_sessions', 'local_md', 'bon', 'knowledge', 'amp']),
+              type=click.Choice([spec.name for spec in ADAPTERS]),
               help="Only scan this source type")
 @click.pass_context
 def scan(ctx, dry_run, source_filter):
@@ -26,456 +434,44 @@ def scan(ctx, dry_run, source_filter):
     config = ctx.obj['config']
 
     # Determine which sources to scan
-    scan_claude_code = source_filter is None or source_filter == 'claude_code'
-    scan_claude_ai = source_filter is None or source_filter == 'claude_ai'
-    scan_handoffs = source_filter is None or source_filter == 'handoffs'
-    scan_cloud = source_filter is None or source_filter == 'cloud_sessions'
-    scan_local_md = source_filter is None or source_filter == 'local_md'
-    scan_bon = source_filter is None or source_filter == 'bon'
-    scan_knowledge = source_filter is None or source_filter == 'knowledge'
-    scan_amp = source_filter is None or source_filter == 'amp'
-
-    if not scan_claude_code:
-        click.echo(f"Skipping Claude Code conversations...")
+    enabled = [spec for spec in ADAPTERS if source_filter in (None, spec.name)]
+
+    # Start every enabled discovery walk now so they overlap; each adapter
+    # below consumes its own stream in turn and all writes stay on this thread.
+    discovered = {spec.name: prefetch(spec.discover(config)) for spec in enabled}
+
+    first = ADAPTERS[0]
+    if first not in enabled:
+        click.echo(f"Skipping {first.heading}...")
     else:
-        click.echo(f"Scanning Claude Code conversations...")
+        click.echo(f"Scanning {first.heading}...")
 
+    counts = {spec.name: {'new': 0, 'updated': 0, 'skipped': 0, 'extracted': 0} for spec in ADAPTERS}
+    # Per-source lines are buffered; section headers flush them
+    out = _EchoBuffer()
     db = get_database()
-    with db:
-        new_count = 0
-        updated_count = 0
-        skipped_count = 0
-
-        if scan_claude_code:
-            for source in discover_claude_code(config):
-                exists = db.source_exists(source.source_id)
-
-                if dry_run:
-                    status = "exists" if exists else "new"
-                    click.echo(f"  [{status}] {source.source_id}: {source.title[:60]}...")
-                    if not exists:
-                        new_count += 1
-                    continue
-
-                # Store source metadata
-                db.upsert_source(
-                    source_id=source.source_id,
-                    source_type='claude_code',
-                    title=source.title,
-                    path=str(source.path),
-                    created_at=source.created_at,
-                    updated_at=source.updated_at,
-                    is_subagent=source.is_subagent,
-                    project_path=source.project_path,
-                    metadata=source.metadata,
-                )
-
-                # Create summary (use presummary if available, else basic extraction)
-                summary = _create_basic_summary(source)
-                db.upsert_summary(
-                    source_id=source.source_id,
-                    summary_text=summary,
-                    has_presummary=source.has_presummary,
-                    raw_text=source.full_text(),
-                )
-                db.mark_processed(source.source_id)
-
-                if exists:
-                    updated_count += 1
-                else:
-                    new_count += 1
-                    click.echo(f"  + {source.title[:70]}...")
-
-        # Scan Claude.ai conversations
-        ai_new = 0
-        ai_updated = 0
-
-        if scan_claude_ai:
-            click.echo(f"\nScanning Claude.ai conversations...")
-            for source in discover_claude_ai(config):
-                exists = db.source_exists(source.source_id)
-
-                if dry_run:
-                    status = "exists" if exists else "new"
-                    click.echo(f"  [{status}] {source.source_id}: {source.name[:60]}...")
-                    if not exists:
-                        ai_new += 1
-                    continue
-
-                # Store source metadata
-                db.upsert_source(
-                    source_id=source.source_id,
-                    source_type='claude_ai',
-                    title=source.name,
-                    path=f"claude_ai:{source.uuid}",  # Virtual path using UUID
-                    created_at=source.created_at,
-                    updated_at=source.updated_at,
-                )
-
-                # Use pre-generated summary (Claude.ai has these)
-                summary = source.summary if source.summary else source.name
-                db.upsert_summary(
-                    source_id=source.source_id,
-                    summary_text=summary,
-                    has_presummary=source.has_presummary,
-                    raw_text=source.full_text(),
-                )
-                db.mark_processed(source.source_id)
-
-                if exists:
-                    ai_updated += 1
-                else:
-                    ai_new += 1
-                    click.echo(f"  + {source.name[:70]}...")
-
-        # Scan handoff files
-        handoff_new = 0
-        handoff_updated = 0
-
-        handoff_extracted = 0
-        handoff_skipped = 0
-
-        if scan_handoffs:
-            click.echo(f"\nScanning handoff files...")
-            for source in discover_handoffs(config):
-                existing = db.get_source(source.source_id)
-                mtime_str = str(source.mtime)
-
-                if existing and existing.get('content_hash') == mtime_str:
-                    handoff_skipped += 1
-                    continue
-
-                if dry_run:
-                    status = "exists" if existing else "new"
-                    click.echo(f"  [{status}] {source.source_id}: {source.title[:60]}...")
-                    if not existing:
-                        handoff_new += 1
-                    continue
-
-                exists = existing is not None
-
-                # Store source metadata (include session_id for backfill dedup)
-                metadata = {'session_id': source.session_id} if source.session_id else None
-                db.upsert_source(
-                    source_id=source.source_id,
-                    source_type='handoff',
-                    title=source.title,
-                    path=str(source.path),
-                    created_at=source.date,
-                    updated_at=source.date,
-                    project_path=source.project_path,
-                    content_hash=mtime_str,
-                    metadata=metadata,
-                )
-
-                # Use full text as summary (handoffs are already distilled)
-                full_text = source.full_text()
-                db.upsert_summary(
-                    source_id=source.source_id,
-                    summary_text=full_text,
-                    has_presummary=True,
-                    raw_text=full_text,
-                )
-
-                # Extract structured fields from handoff sections (free, no LLM)
-                extraction = source.to_extraction()
-                if extraction:
-                    db.upsert_extraction(
-                        source_id=source.source_id,
-                        summary=extraction.get('summary'),
-                        arc=extraction.get('arc'),
-                        builds=extraction.get('builds'),
-                        learnings=extraction.get('learnings'),
-                        friction=extraction.get('friction'),
-                        patterns=extraction.get('patterns'),
-                        open_threads=extraction.get('open_threads'),
-                        model_used='handoff-section-parse',
-                    )
-                    # Sync to FTS for searchability
-                    rich_text = _flatten_extraction_for_fts(extraction)
-                    if rich_text:
-                        db.upsert_summary(
-                            source_id=source.source_id,
-                            summary_text=rich_text,
-                            has_presummary=True,
-                            raw_text=full_text,
-                        )
-                    handoff_extracted += 1
-
-                db.mark_processed(source.source_id)
-
-                if exists:
-                    handoff_updated += 1
-                else:
-                    handoff_new += 1
-                    click.echo(f"  + {source.title[:70]}...")
-
-        # Scan cloud sessions (Claude Code for web)
-        cloud_new = 0
-        cloud_updated = 0
-
-        if scan_cloud:
-            click.echo(f"\nScanning cloud sessions...")
-            for source in discover_cloud_sessions(config):
-                exists = db.source_exists(source.source_id)
-
-                if dry_run:
-                    status = "exists" if exists else "new"
-                    click.echo(f"  [{status}] {source.source_id}: {source.title[:60]}...")
-                    if not exists:
-                        cloud_new += 1
-                    continue
-
-                # Store source metadata
-                db.upsert_source(
-                    source_id=source.source_id,
-                    source_type='cloud_session',
-                    title=source.title,
-                    path=str(source.path),
-                    created_at=source.created_at,
-                    updated_at=source.updated_at,
-                    metadata=source.metadata,
-                )
-
-                # Use summary if available, else full text
-                summary = source.summary_text if source.summary_text else source.full_text()[:500]
-                db.upsert_summary(
-                    source_id=source.source_id,
-                    summary_text=summary,
-                    has_presummary=source.has_presummary,
-                    raw_text=source.full_text(),
-                )
-                db.mark_processed(source.source_id)
-
-                if exists:
-                    cloud_updated += 1
-                else:
-                    cloud_new += 1
-                    click.echo(f"  + {source.title[:70]}...")
-
-        # Scan local markdown files
-        local_md_new = 0
-        local_md_updated = 0
-        local_md_skipped = 0
-
-        if scan_local_md:
-            click.echo(f"\nScanning local markdown files...")
-            for source in discover_local_md(config):
-                # Check if file has changed since last scan (mtime-based)
-                existing = db.get_source(source.source_id)
-                mtime_str = str(source.mtime)
-
-                if existing and existing.get('content_hash') == mtime_str:
-                    # File unchanged, skip processing
-                    local_md_skipped += 1
-                    continue
-
-                if dry_run:
-                    status = "exists" if existing else "new"
-                    click.echo(f"  [{status}] {source.source_id}: {source.title[:60]}...")
-                    if not existing:
-                        local_md_new += 1
-                    continue
-
-                # Store source metadata with mtime for change detection
-                db.upsert_source(
-                    source_id=source.source_id,
-                    source_type='local_md',
-                    title=source.title,
-                    path=str(source.path),
-                    created_at=source.date,
-                    updated_at=source.date,
-                    project_path=source.project_path,
-                    content_hash=mtime_str,
-                )
-
-                # Index full content (no LLM summarization)
-                # For local_md, summary_text = raw_text (both are full content)
-                full_text = source.full_text()
-                db.upsert_summary(
-                    source_id=source.source_id,
-                    summary_text=full_text,
-                    has_presummary=False,
-                    raw_text=full_text,
-                )
-                db.mark_processed(source.source_id)
-
-                if existing:
-                    local_md_updated += 1
-                else:
-                    local_md_new += 1
-                    if local_md_new <= 10:  # Limit output for large scans
-                        click.echo(f"  + {source.title[:70]}...")
-                    elif local_md_new == 11:
-                        click.echo(f"  ... (limiting output)")
-
-        # Scan bon (lightweight work tracker)
-        bon_new = 0
-        bon_updated = 0
-        bon_skipped = 0
-
-        if scan_bon:
-            click.echo(f"\nScanning bon...")
-            for source in discover_bon(config):
-                existing = db.get_source(source.source_id)
-                created_at_str = source.created_at.isoformat() if source.created_at else ''
-
-                # Use done_at for change detection (items change when completed)
-                change_key = f"{created_at_str}:{source.status}"
-                if existing and existing.get('content_hash') == change_key:
-                    bon_skipped += 1
-                    continue
-
-                if dry_run:
-                    status = "exists" if existing else "new"
-                    click.echo(f"  [{status}] {source.source_id}: {source.title[:60]}...")
-                    if not existing:
-                        bon_new += 1
-                    continue
-
-                db.upsert_source(
-                    source_id=source.source_id,
-                    source_type='bon',
-                    title=source.title,
-                    path=str(source.path),
-                    created_at=source.created_at,
-                    updated_at=source.done_at or source.created_at,
-                    project_path=source.project_path,
-                    content_hash=change_key,
-                    metadata=source.metadata,
-                )
-
-                full_text = source.full_text()
-                db.upsert_summary(
-                    source_id=source.source_id,
-                    summary_text=full_text,
-                    has_presummary=True,
-                    raw_text=full_text,
-                )
-                db.mark_processed(source.source_id)
-
-                if existing:
-                    bon_updated += 1
-                else:
-                    bon_new += 1
-                    click.echo(f"  + {source.title[:70]}...")
-
-        # Scan knowledge articles
-        knowledge_new = 0
-        knowledge_updated = 0
-        knowledge_skipped = 0
-
-        if scan_knowledge:
-            click.echo(f"\nScanning knowledge articles...")
-            for source in discover_knowledge(config):
-                # Check if file has changed since last scan (mtime-based)
-                existing = db.get_source(source.source_id)
-                mtime_str = str(source.mtime)
-
-                if existing and existing.get('content_hash') == mtime_str:
-                    # File unchanged, skip processing
-                    knowledge_skipped += 1
-                    continue
-
-                if dry_run:
-                    status = "exists" if existing else "new"
-                    click.echo(f"  [{status}] {source.source_id}: {source.title[:60]}...")
-                    if not existing:
-                        knowledge_new += 1
-                    continue
-
-                # Store source metadata with mtime for change detection
-                db.upsert_source(
-                    source_id=source.source_id,
-                    source_type='knowledge',
-                    title=source.title,
-                    path=str(source.path),
-                    created_at=source.date,
-                    updated_at=source.date,
-                    project_path=source.project_path,
-                    content_hash=mtime_str,
-                )
-
-                # Index full content (knowledge is already distilled)
-                full_text = source.full_text()
-                db.upsert_summary(
-                    source_id=source.source_id,
-                    summary_text=full_text,
-                    has_presummary=True,
-                    raw_text=full_text,
-                )
-                db.mark_processed(source.source_id)
-
-                if existing:
-                    knowledge_updated += 1
-                else:
-                    knowledge_new += 1
-                    if knowledge_new <= 10:
-                        click.echo(f"  + {source.title[:70]}...")
-                    elif knowledge_new == 11:
-                        click.echo(f"  ... (limiting output)")
-
-        # Scan Amp threads
-        amp_new = 0
-        amp_updated = 0
-        amp_skipped = 0
-
-        if scan_amp:
-            click.echo(f"\nScanning Amp threads...")
-            for source in discover_amp(config):
-                existing = db.get_source(source.source_id)
-                # Use updated_at for change detection (new messages update this)
-                change_key = source.updated_at.isoformat()
-
-                if existing and existing.get('content_hash') == change_key:
-                    amp_skipped += 1
-                    continue
-
-                if dry_run:
-                    status = "exists" if existing else "new"
-                    click.echo(f"  [{status}] {source.source_id}: {source.title[:60]}")
-                    if not existing:
-                        amp_new += 1
-                    continue
-
-                db.upsert_source(
-                    source_id=source.source_id,
-                    source_type='amp',
-                    title=source.title,
-                    path=str(source.path),
-                    created_at=source.created_at,
-                    updated_at=source.updated_at,
-                    project_path=source.project_path,
-                    content_hash=change_key,
-                    metadata=source.metadata,
-                )
-
-                full_text = source.full_text()
-                if full_text:
-                    db.upsert_summary(
-                        source_id=source.source_id,
-                        summary_text=source.title,  # Placeholder until backfill or amp-close extracts
-                        has_presummary=False,  # Needs LLM extraction — title is NOT a real summary
-                        raw_text=full_text,
-                    )
-
-                if existing:
-                    amp_updated += 1
-                else:
-                    amp_new += 1
-                    click.echo(f"  + {source.title[:70]}")
-
-        if dry_run:
-            click.echo(f"\nDry run: {new_count} Claude Code, {ai_new} Claude.ai, {handoff_new} handoffs, {cloud_new} cloud, {local_md_new} local_md, {bon_new} bon, {knowledge_new} knowledge, {amp_new} amp new")
-        else:
-            total_new = new_count + ai_new + handoff_new + cloud_new + local_md_new + bon_new + knowledge_new + amp_new
-            total_updated = updated_count + ai_updated + handoff_updated + cloud_updated + local_md_updated + bon_updated + knowledge_updated + amp_updated
-            click.echo(f"\nIndexed: {total_new} new, {total_updated} updated")
-            click.echo(f"  Claude Code: {new_count} new, {updated_count} updated")
-            click.echo(f"  Claude.ai: {ai_new} new, {ai_updated} updated")
-            click.echo(f"  Handoffs: {handoff_new} new, {handoff_updated} updated, {handoff_skipped} unchanged, {handoff_extracted} extracted")
-            click.echo(f"  Cloud sessions: {cloud_new} new, {cloud_updated} updated")
-            click.echo(f"  Local markdown: {local_md_new} new, {local_md_updated} updated, {local_md_skipped} unchanged")
-            click.echo(f"  Bon: {bon_new} new, {bon_updated} updated, {bon_skipped} unchanged")
-            click.echo(f"  Knowledge: {knowledge_new} new, {knowledge_updated} updated, {knowledge_skipped} unchanged")
-            click.echo(f"  Amp: {amp_new} new, {amp_updated} updated, {amp_skipped} unchanged")
+    # One transaction per batch of writes rather than one per upsert
+    with db, db.batch():
+        db.configure_for_writes()
+        for spec in enabled:
+            if spec is not first:
+                out.flush()
+                click.echo(f"\nScanning {spec.heading}...")
+            counts[spec.name] = _scan_adapter(spec, discovered[spec.name], db, dry_run, out)
+        out.flush()
+
+    if dry_run:
+        new = ', '.join(f"{counts[spec.name]['new']} {spec.dry_run_label}" for spec in ADAPTERS)
+        click.echo(f"\nDry run: {new} new")
+    else:
+        total_new = sum(c['new'] for c in counts.values())
+        total_updated = sum(c['updated'] for c in counts.values())
+        click.echo(f"\nIndexed: {total_new} new, {total_updated} updated")
+        for spec in ADAPTERS:
+            c = counts[spec.name]
+            line = f"  {spec.label}: {c['new']} new, {c['updated']} updated"
+            if spec.change_key:
+                line += f", {c['skipped']} unchanged"
+            if spec.reports_extracted:
+                line += f", {c['extracted']} extracted"
+            click.echo(line)
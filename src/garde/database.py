@@ -12,11 +12,40 @@ import sqlite3
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 
 from .config import get_db_path
 
+# Writes per transaction inside Database.batch()
+BATCH_COMMIT_EVERY = 1000
+
+# Upserts shared by the single-row and batch methods; sqlite3 keeps one
+# prepared statement per distinct SQL string on the connection.
+UPSERT_SOURCE_SQL = """
+    INSERT INTO sources (id, source_type, title, path, created_at, updated_at,
+                        is_subagent, project_path, content_hash, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        title = excluded.title,
+        path = excluded.path,
+        updated_at = excluded.updated_at,
+        content_hash = excluded.content_hash,
+        metadata = excluded.metadata
+"""
+
+UPSERT_SUMMARY_SQL = """
+    INSERT INTO summaries (source_id, summary_text, has_presummary, word_count, raw_text, title)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(source_id) DO UPDATE SET
+        summary_text = excluded.summary_text,
+        has_presummary = excluded.has_presummary,
+        word_count = excluded.word_count,
+        raw_text = excluded.raw_text,
+        title = excluded.title
+"""
+
 
 SCHEMA = """
 -- Sources: metadata for everything we've seen
@@ -142,6 +171,8 @@ END;
 CREATE INDEX IF NOT EXISTS idx_sources_type ON sources(source_type);
 CREATE INDEX IF NOT EXISTS idx_sources_status ON sources(status);
 CREATE INDEX IF NOT EXISTS idx_sources_subagent ON sources(is_subagent) WHERE is_subagent = TRUE;
+-- Case-insensitive prefix ranges for `recent`'s project filter
+CREATE INDEX IF NOT EXISTS idx_sources_project_path_nocase ON sources(project_path COLLATE NOCASE);
 CREATE INDEX IF NOT EXISTS idx_pending_status ON pending_entities(status);
 CREATE INDEX IF NOT EXISTS idx_source_entities_entity ON source_entities(entity_id);
 CREATE INDEX IF NOT EXISTS idx_extractions_model ON extractions(model_used);
@@ -149,6 +180,49 @@ CREATE INDEX IF NOT EXISTS idx_file_mentions_source ON file_mentions(source_id);
 """
 
 
+def _source_params(
+    source_id: str,
+    source_type: str,
+    title: str,
+    path: str | None = None,
+    created_at: datetime | None = None,
+    updated_at: datetime | None = None,
+    is_subagent: bool = False,
+    project_path: str | None = None,
+    content_hash: str | None = None,
+    metadata: dict | None = None,
+) -> tuple:
+    """Build the UPSERT_SOURCE_SQL parameters for one source."""
+    return (
+        source_id,
+        source_type,
+        title,
+        path,
+        created_at.isoformat() if created_at else None,
+        updated_at.isoformat() if updated_at else None,
+        is_subagent,
+        project_path,
+        content_hash,
+        json.dumps(metadata) if metadata else None,
+    )
+
+
+def _extraction_from_row(row: sqlite3.Row) -> dict:
+    """Turn an extractions row into a dict with its JSON fields parsed."""
+    return {
+        'source_id': row['source_id'],
+        'summary': row['summary'],
+        'arc': json.loads(row['arc']) if row['arc'] else None,
+        'builds': json.loads(row['builds']) if row['builds'] else None,
+        'learnings': json.loads(row['learnings']) if row['learnings'] else None,
+        'friction': json.loads(row['friction']) if row['friction'] else None,
+        'patterns': json.loads(row['patterns']) if row['patterns'] else None,
+        'open_threads': json.loads(row['open_threads']) if row['open_threads'] else None,
+        'model_used': row['model_used'],
+        'extracted_at': row['extracted_at'],
+    }
+
+
 @dataclass
 class SearchResult:
     """A search result from FTS5."""
@@ -172,6 +246,9 @@ class Database:
         self.db_path = db_path or get_db_path()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn = None
+        # Set while inside batch(): commit every N writes instead of every write
+        self._batch_every: int | None = None
+        self._pending_writes = 0
 
     def connect(self):
         """Get or create database connection."""
@@ -233,12 +310,59 @@ class Database:
         except sqlite3.OperationalError:
             pass  # Triggers don't exist or migration already done
 
+        # Migration 4: recent's project filter is case-insensitive; the
+        # case-sensitive index it used to seek is replaced by the NOCASE one
+        self._conn.execute("DROP INDEX IF EXISTS idx_sources_project_path")
+
     def close(self):
         """Close database connection."""
         if self._conn:
             self._conn.close()
             self._conn = None
 
+    def configure_for_writes(self):
+        """Tune this connection for a bulk write session such as scan or sync-fts.
+
+        With WAL, synchronous=NORMAL only syncs at checkpoints and stays
+        safe against application crashes. Temp tables and the page cache
+        get more memory and the file is mapped. Settings last for the
+        connection only, so read-only commands keep SQLite's defaults.
+        """
+        conn = self.connect()
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+
+    def _commit(self):
+        """Commit a write, or defer it to the next batch boundary inside batch()."""
+        if self._batch_every is None:
+            self._conn.commit()
+            return
+        self._pending_writes += 1
+        if self._pending_writes >= self._batch_every:
+            self._conn.commit()
+            self._pending_writes = 0
+
+    @contextmanager
+    def batch(self, every: int = BATCH_COMMIT_EVERY) -> Iterator['Database']:
+        """Group writes into transactions of up to `every` operations.
+
+        Each write method normally commits on its own, which costs a WAL
+        sync per call. Inside this block commits happen every `every`
+        writes and once on exit (including on error, so work done before
+        a failure is kept as it would be without batching).
+        """
+        conn = self.connect()
+        self._batch_every = every
+        self._pending_writes = 0
+        try:
+            yield self
+        finally:
+            self._batch_every = None
+            self._pending_writes = 0
+            conn.commit()
+
     def __enter__(self):
         self.connect()
         return self
@@ -263,30 +387,20 @@ class Database:
     ) -> None:
         """Insert or update a source."""
         conn = self.connect()
-        metadata_json = json.dumps(metadata) if metadata else None
-        conn.execute("""
-            INSERT INTO sources (id, source_type, title, path, created_at, updated_at,
-                                is_subagent, project_path, content_hash, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(id) DO UPDATE SET
-                title = excluded.title,
-                path = excluded.path,
-                updated_at = excluded.updated_at,
-                content_hash = excluded.content_hash,
-                metadata = excluded.metadata
-        """, (
-            source_id,
-            source_type,
-            title,
-            path,
-            created_at.isoformat() if created_at else None,
-            updated_at.isoformat() if updated_at else None,
-            is_subagent,
-            project_path,
-            content_hash,
-            metadata_json,
+        conn.execute(UPSERT_SOURCE_SQL, _source_params(
+            source_id, source_type, title, path, created_at, updated_at,
+            is_subagent, project_path, content_hash, metadata,
         ))
-        conn.commit()
+        self._commit()
+
+    def upsert_sources_batch(self, rows: Iterable[dict]) -> None:
+        """Insert or update many sources with one executemany.
+
+        Each row is a dict of upsert_source() keyword arguments.
+        """
+        conn = self.connect()
+        conn.executemany(UPSERT_SOURCE_SQL, (_source_params(**row) for row in rows))
+        self._commit()
 
     def get_source(self, source_id: str) -> dict | None:
         """Get source by ID."""
@@ -327,7 +441,24 @@ class Database:
             SET status = 'processed', processed_at = ?
             WHERE id = ?
         """, (datetime.now().isoformat(), source_id))
-        conn.commit()
+        self._commit()
+
+    def mark_processed_batch(self, source_ids: Iterable[str]) -> None:
+        """Mark many sources as processed, one UPDATE per chunk of ids."""
+        conn = self.connect()
+        ids = list(source_ids)
+        processed_at = datetime.now().isoformat()
+        # Stay well under SQLite's host-parameter limit
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            conn.execute(f"""
+                UPDATE sources
+                SET status = 'processed', processed_at = ?
+                WHERE id IN ({placeholders})
+            """, (processed_at, *chunk))
+        if ids:
+            self._commit()
 
     def source_exists(self, source_id: str) -> bool:
         """Check if source already exists."""
@@ -335,6 +466,19 @@ class Database:
         cursor = conn.execute("SELECT 1 FROM sources WHERE id = ?", (source_id,))
         return cursor.fetchone() is not None
 
+    def get_existing_hashes(self, source_type: str) -> dict[str, str | None]:
+        """Map id -> content_hash for every source of one type.
+
+        One query up front lets scan test existence and change keys in
+        memory instead of looking up each discovered source.
+        """
+        conn = self.connect()
+        cursor = conn.execute(
+            "SELECT id, content_hash FROM sources WHERE source_type = ?",
+            (source_type,)
+        )
+        return {row[0]: row[1] for row in cursor}
+
     def delete_source(self, source_id: str) -> bool:
         """Delete a source and all related data.
 
@@ -367,7 +511,7 @@ class Database:
             "UPDATE sources SET status = 'stale' WHERE id = ?",
             (source_id,)
         )
-        conn.commit()
+        self._commit()
         return cursor.rowcount > 0
 
     def mark_stale_batch(self, source_ids: list[str]) -> int:
@@ -377,19 +521,21 @@ class Database:
             "UPDATE sources SET status = 'stale' WHERE id = ?",
             [(sid,) for sid in source_ids]
         )
-        conn.commit()
+        self._commit()
         return cursor.rowcount
 
     def get_sources_with_paths(
         self,
         source_type: str | None = None,
-        include_stale: bool = False
+        include_stale: bool = False,
+        exclude_types: tuple[str, ...] = (),
     ) -> list[dict]:
         """Get all sources that have filesystem paths.
 
         Args:
             source_type: Optional filter by source type
             include_stale: If False (default), exclude sources already marked stale
+            exclude_types: Source types to leave out (e.g. virtual-path types)
 
         Returns:
             List of source dicts with id, source_type, path, title
@@ -405,6 +551,10 @@ class Database:
             query += " AND source_type = ?"
             params.append(source_type)
 
+        if exclude_types:
+            query += f" AND source_type NOT IN ({','.join('?' * len(exclude_types))})"
+            params.extend(exclude_types)
+
         cursor = conn.execute(query, params)
         return [dict(row) for row in cursor.fetchall()]
 
@@ -428,25 +578,39 @@ class Database:
             title: Session title (denormalized from sources for FTS)
         """
         conn = self.connect()
+        conn.execute(UPSERT_SUMMARY_SQL, self._summary_params(
+            source_id, summary_text, has_presummary, raw_text, title,
+        ))
+        self._commit()
+
+    def upsert_summaries_batch(self, rows: Iterable[dict]) -> None:
+        """Insert or update many summaries with one executemany.
+
+        Each row is a dict of upsert_summary() keyword arguments. Write the
+        matching sources first when rows rely on the title lookup.
+        """
+        conn = self.connect()
+        conn.executemany(UPSERT_SUMMARY_SQL, [self._summary_params(**row) for row in rows])
+        self._commit()
+
+    def _summary_params(
+        self,
+        source_id: str,
+        summary_text: str,
+        has_presummary: bool = False,
+        raw_text: str | None = None,
+        title: str | None = None,
+    ) -> tuple:
+        """Build the UPSERT_SUMMARY_SQL parameters for one summary."""
         word_count = len(summary_text.split())
         # Cap raw_text at 100K chars
         if raw_text and len(raw_text) > 100_000:
             raw_text = raw_text[:100_000]
         # If title not provided, fetch from sources
         if title is None:
-            row = conn.execute("SELECT title FROM sources WHERE id = ?", (source_id,)).fetchone()
+            row = self.connect().execute("SELECT title FROM sources WHERE id = ?", (source_id,)).fetchone()
             title = row[0] if row else None
-        conn.execute("""
-            INSERT INTO summaries (source_id, summary_text, has_presummary, word_count, raw_text, title)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(source_id) DO UPDATE SET
-                summary_text = excluded.summary_text,
-                has_presummary = excluded.has_presummary,
-                word_count = excluded.word_count,
-                raw_text = excluded.raw_text,
-                title = excluded.title
-        """, (source_id, summary_text, has_presummary, word_count, raw_text or '', title))
-        conn.commit()
+        return (source_id, summary_text, has_presummary, word_count, raw_text or '', title)
 
     # Extraction operations
 
@@ -499,7 +663,7 @@ class Database:
                 WHERE source_id = ?
             """, (summary, source_id))
 
-        conn.commit()
+        self._commit()
 
     def get_extraction(self, source_id: str) -> dict | None:
         """Get extraction for a source, with JSON fields parsed."""
@@ -511,18 +675,22 @@ class Database:
         row = cursor.fetchone()
         if not row:
             return None
-        return {
-            'source_id': row['source_id'],
-            'summary': row['summary'],
-            'arc': json.loads(row['arc']) if row['arc'] else None,
-            'builds': json.loads(row['builds']) if row['builds'] else None,
-            'learnings': json.loads(row['learnings']) if row['learnings'] else None,
-            'friction': json.loads(row['friction']) if row['friction'] else None,
-            'patterns': json.loads(row['patterns']) if row['patterns'] else None,
-            'open_threads': json.loads(row['open_threads']) if row['open_threads'] else None,
-            'model_used': row['model_used'],
-            'extracted_at': row['extracted_at'],
-        }
+        return _extraction_from_row(row)
+
+    def get_extractions(self, source_ids: list[str]) -> dict[str, dict]:
+        """Get extractions for many sources in one query, keyed by source_id.
+
+        Sources without an extraction are absent from the result.
+        """
+        if not source_ids:
+            return {}
+        conn = self.connect()
+        placeholders = ','.join('?' * len(source_ids))
+        rows = conn.execute(
+            f"SELECT * FROM extractions WHERE source_id IN ({placeholders})",
+            source_ids
+        ).fetchall()
+        return {row['source_id']: _extraction_from_row(row) for row in rows}
 
     def has_extraction(self, source_id: str) -> bool:
         """Check if source has a hybrid extraction."""
@@ -637,7 +805,7 @@ class Database:
             (source_id, entity_id, mention_text, confidence)
             VALUES (?, ?, ?, ?)
         """, (source_id, entity_id, mention_text, confidence))
-        conn.commit()
+        self._commit()
 
     def queue_pending_entity(
         self,
@@ -653,7 +821,7 @@ class Database:
             (mention_text, source_id, suggested_entity, confidence)
             VALUES (?, ?, ?, ?)
         """, (mention_text, source_id, suggested_entity, confidence))
-        conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def get_pending_entities(
@@ -692,7 +860,7 @@ class Database:
             SET status = ?, resolution = ?
             WHERE id = ?
         """, (status, resolution, pending_id))
-        conn.commit()
+        self._commit()
 
     def get_entities_for_source(self, source_id: str) -> list[dict]:
         """Get all resolved entities for a source."""
@@ -720,7 +888,7 @@ class Database:
             (source_id, file_path, operation)
             VALUES (?, ?, ?)
         """, (source_id, file_path, operation))
-        conn.commit()
+        self._commit()
 
     def add_file_mentions_batch(
         self,
@@ -729,13 +897,26 @@ class Database:
         operation: str | None = None,
     ) -> int:
         """Add multiple file mentions for a source. Returns count added."""
+        return self.add_file_mentions_bulk(
+            ((source_id, fp) for fp in file_paths), operation
+        )
+
+    def add_file_mentions_bulk(
+        self,
+        mentions: Iterable[tuple[str, str]],
+        operation: str | None = None,
+    ) -> int:
+        """Add (source_id, file_path) mentions across many sources in one commit.
+
+        Returns count added (duplicates are ignored).
+        """
         conn = self.connect()
         cursor = conn.executemany("""
             INSERT OR IGNORE INTO file_mentions
             (source_id, file_path, operation)
             VALUES (?, ?, ?)
-        """, [(source_id, fp, operation) for fp in file_paths])
-        conn.commit()
+        """, [(source_id, fp, operation) for source_id, fp in mentions])
+        self._commit()
         return cursor.rowcount
 
     def search_files(
@@ -19,7 +19,7 @@ class ExtractionResult:
     entities_found: int
     matched: int      # Matched existing glossary entity
     pending: int      # Queued for resolution
-    entities: list[dict]
+    entities: list[dict]  # Well-formed entries carry 'matched': bool
 
 
 def extract_from_source(
@@ -69,6 +69,7 @@ def extract_from_source(
                 mention_text=mention,
                 confidence=confidence,
             )
+            entity['matched'] = True
             matched += 1
         elif suggested:
             # Has suggestion - check if suggestion is known
@@ -80,6 +81,7 @@ def extract_from_source(
                     mention_text=mention,
                     confidence=confidence,
                 )
+                entity['matched'] = True
                 matched += 1
             else:
                 # Suggested entity not in glossary - queue for review
@@ -89,6 +91,7 @@ def extract_from_source(
                     suggested_entity=suggested,
                     confidence=confidence,
                 )
+                entity['matched'] = False
                 pending += 1
         else:
             # Completely unknown - queue for review
@@ -98,6 +101,7 @@ def extract_from_source(
                 suggested_entity=None,
                 confidence=confidence,
             )
+            entity['matched'] = False
             pending += 1
 
     if skipped > 0:
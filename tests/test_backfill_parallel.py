@@ -0,0 +1,86 @@
+"""Tests for backfill's threaded extraction (--parallel).
+
+extract_hybrid is replaced with a stand-in so no LLM is called; the
+tests cover how results are written back and what happens on interrupt.
+"""
+
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from garde.cli import main
+from garde.database import Database
+from garde.glossary import Glossary
+
+
+@pytest.fixture
+def env(monkeypatch):
+    """Temp database wired into backfill, with config and glossary stubbed."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / 'test.db'
+        monkeypatch.setattr('garde.cli.extract_cmds.get_database', lambda: Database(db_path))
+        monkeypatch.setattr('garde.cli.load_config', lambda: {})
+        monkeypatch.setattr('garde.cli.load_glossary', lambda: Glossary({'entities': {}}))
+        yield Database(db_path)
+
+
+def _add_sources(db, count, text='x' * 200):
+    with db:
+        for i in range(count):
+            db.upsert_source(source_id=f'local_md:{i}', source_type='local_md', title=f'Note {i}')
+            db.upsert_summary(source_id=f'local_md:{i}', summary_text=text)
+
+
+def test_parallel_backfill_writes_every_result(env, monkeypatch):
+    """Each source is extracted once and written from the main thread."""
+    _add_sources(env, 6)
+    with env:
+        env.upsert_source(source_id='local_md:short', source_type='local_md', title='Short')
+        env.upsert_summary(source_id='local_md:short', summary_text='tiny')
+
+    calls = []
+
+    def fake_extract(full_text, messages=None):
+        calls.append(threading.current_thread().name)
+        return {'summary': 'Done', 'builds': [{'what': 'x'}], 'learnings': []}
+
+    monkeypatch.setattr('garde.llm.extract_hybrid', fake_extract)
+
+    result = CliRunner().invoke(main, ['backfill', '-n', '20', '--skip-short', '--parallel', '3'])
+
+    assert result.exit_code == 0, result.output
+    assert 'Backfill complete: 6 processed, 0 failed' in result.output
+    assert len(calls) == 6
+    assert threading.main_thread().name not in calls
+    with env:
+        models = dict(env.connect().execute("SELECT source_id, model_used FROM extractions").fetchall())
+    assert models.pop('local_md:short') == 'skipped:content_too_short'
+    assert len(models) == 6
+
+
+def test_interrupt_cancels_queued_extractions(env, monkeypatch):
+    """Ctrl-C while writing results doesn't run the rest of the queue."""
+    _add_sources(env, 6)
+    calls = []
+
+    def slow_extract(full_text, messages=None):
+        calls.append(full_text)
+        time.sleep(0.05)
+        return {'summary': 'Done'}
+
+    def interrupt(self, **kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr('garde.llm.extract_hybrid', slow_extract)
+    monkeypatch.setattr(Database, 'upsert_extraction', interrupt)
+
+    result = CliRunner().invoke(main, ['backfill', '-n', '20', '--parallel', '1'])
+
+    assert result.exit_code != 0
+    # The first result triggers the interrupt; at most the one already
+    # running when it arrives still finishes
+    assert len(calls) <= 2
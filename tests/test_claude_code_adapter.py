@@ -7,7 +7,7 @@ import pytest
 from pathlib import Path
 from datetime import datetime
 
-from src.garde.adapters.claude_code import ClaudeCodeSource, _get_quick_summary, clean_title, discover_claude_code
+from src.garde.adapters.claude_code import ClaudeCodeSource, _get_quick_summary, _has_min_lines, clean_title, discover_claude_code
 
 
 @pytest.fixture
@@ -184,6 +184,19 @@ def test_quick_summary_uses_summary_entry(tmp_jsonl):
     assert summary == "Database migration session"
 
 
+# _has_min_lines counts a final unterminated line and stops early
+def test_has_min_lines(tmp_path):
+    path = tmp_path / "lines.jsonl"
+    path.write_bytes(b"a\nb\nc")
+    assert _has_min_lines(path, 3)
+    assert not _has_min_lines(path, 4)
+    assert _has_min_lines(path, 0)
+
+    path.write_bytes(b"a\n" * 100_000)
+    assert _has_min_lines(path, 10)
+    assert not _has_min_lines(path, 100_001)
+
+
 # clean_title should strip command XML tags from titles
 def test_clean_title_strips_command_tags():
     # Single tag
@@ -175,6 +175,47 @@ def test_drill_cloud_session_shows_messages(temp_memory_dir, runner, monkeypatch
     assert 'run the tests now' in result.output
 
 
+# --turn N on a claude_code source shows that turn (regression: the option
+# was clobbered by the loop variable while building the turn list)
+def test_drill_claude_code_turn(temp_memory_dir, runner, monkeypatch):
+    """Drill --turn on claude_code source displays the requested turn."""
+    from garde.adapters.claude_code import ClaudeCodeSource
+
+    tmpdir = temp_memory_dir['tmpdir']
+    db = temp_memory_dir['db']
+
+    session_path = Path(tmpdir) / 'abc123.jsonl'
+    session_path.write_text(json.dumps({
+        'type': 'user', 'sessionId': 'abc123', 'timestamp': '2025-12-28T10:00:00Z',
+        'message': {'role': 'user', 'content': 'First question'},
+    }) + '\n')
+
+    db.upsert_source(
+        source_id='claude_code:abc123',
+        source_type='claude_code',
+        title='Test Session',
+        path=str(session_path),
+        created_at=datetime.now(),
+    )
+
+    # Turns come from deglacer; pin them so the test is about drill
+    turns = [
+        {'role': 'human', 'text': 'First question'},
+        {'role': 'system', 'text': 'Compaction summary'},
+        {'role': 'assistant', 'text': 'First answer'},
+        {'role': 'human', 'text': 'Second question'},
+    ]
+    monkeypatch.setattr(ClaudeCodeSource, '_build_turns', lambda self: turns)
+    monkeypatch.setattr('garde.cli.browse.get_database', lambda: Database(temp_memory_dir['db_path']))
+
+    result = runner.invoke(main, ['drill', 'claude_code:abc123', '--turn', '2'])
+
+    assert result.exit_code == 0
+    assert '--- Turn 2 of 3 ---' in result.output
+    assert '[ASSISTANT]\nFirst answer' in result.output
+    assert 'Second question' not in result.output
+
+
 # When drilling an unknown source type, it should show an error
 def test_drill_unknown_source_type(temp_memory_dir, runner, monkeypatch):
     """Drill on unknown source type shows error."""
@@ -236,3 +277,71 @@ def test_search_hyphenated_auto_quoted(temp_memory_dir, runner, monkeypatch):
     assert result.exit_code == 0
     assert 'draw-down' in result.output
     assert '1 results' in result.output
+
+
+# recent's project filter matches Claude Code's cwd encoding, which turns
+# '_' and '.' into '-'
+def test_recent_matches_underscore_repo_path(temp_memory_dir, runner, monkeypatch):
+    """recent finds sessions for a repo whose path contains '_'."""
+    db = temp_memory_dir['db']
+
+    db.upsert_source(
+        source_id='claude_code:abc123',
+        source_type='claude_code',
+        title='Underscore repo session',
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+        project_path='-Users-jane-Repos-my-repo',
+    )
+    db.upsert_source(
+        source_id='claude_code:def456',
+        source_type='claude_code',
+        title='Other repo session',
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+        project_path='-Users-jane-Repos-other',
+    )
+
+    monkeypatch.setattr('garde.cli.browse.get_database', lambda: Database(temp_memory_dir['db_path']))
+    monkeypatch.setattr('garde.cli.browse._resolve_git_root', lambda cwd: '/Users/jane/Repos/my_repo')
+    monkeypatch.setattr('garde.cli.load_config', lambda: {})
+    monkeypatch.setattr('garde.cli.load_glossary', lambda: Glossary({'entities': {}}))
+
+    result = runner.invoke(main, ['recent'])
+
+    assert result.exit_code == 0
+    assert 'Underscore repo session' in result.output
+    assert 'Other repo session' not in result.output
+
+
+def test_recent_project_filter_ignores_case(temp_memory_dir, runner, monkeypatch):
+    """recent matches a stored project_path whose case differs from the cwd's."""
+    db = temp_memory_dir['db']
+
+    db.upsert_source(
+        source_id='claude_code:abc123',
+        source_type='claude_code',
+        title='Mixed case session',
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+        project_path='-users-Jane-repos-My-Repo-sub',
+    )
+    db.upsert_source(
+        source_id='claude_code:def456',
+        source_type='claude_code',
+        title='Other repo session',
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+        project_path='-Users-jane-Repos-other',
+    )
+
+    monkeypatch.setattr('garde.cli.browse.get_database', lambda: Database(temp_memory_dir['db_path']))
+    monkeypatch.setattr('garde.cli.browse._resolve_git_root', lambda cwd: '/Users/jane/Repos/my-repo')
+    monkeypatch.setattr('garde.cli.load_config', lambda: {})
+    monkeypatch.setattr('garde.cli.load_glossary', lambda: Glossary({'entities': {}}))
+
+    result = runner.invoke(main, ['recent'])
+
+    assert result.exit_code == 0
+    assert 'Mixed case session' in result.output
+    assert 'Other repo session' not in result.output
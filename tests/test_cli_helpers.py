@@ -0,0 +1,119 @@
+"""Tests for the query rewrites, summary and path helpers in cli._helpers."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from garde.adapters.claude_code import COMPACTION_PREFIX
+from garde.cli._helpers import (
+    _add_wildcard_suffix, _auto_quote_hyphenated, _create_basic_summary, _missing_paths,
+)
+
+
+@pytest.mark.parametrize('query, expected', [
+    # One word, no hyphen: returned untouched
+    ('OAuth', 'OAuth'),
+    ('', ''),
+    # Hyphenated terms are quoted so FTS5 doesn't read '-' as NOT
+    ('claude-memory', '"claude-memory"'),
+    ('claude-memory foo', '"claude-memory" foo'),
+    ('a-b-c d-e', '"a-b-c" "d-e"'),
+    ('mcp-google OR "x-y"', '"mcp-google" OR "x-y"'),
+    # Quoted spans are left alone, closed or not
+    ('"claude-memory" foo', '"claude-memory" foo'),
+    ('"unclosed claude-memory', '"unclosed claude-memory'),
+    ('"foo"bar', '"foo"bar'),
+    # A lone or dangling hyphen isn't a term
+    ('x - y', 'x - y'),
+    ('-leading', '-leading'),
+    ('trailing-', 'trailing-'),
+    # Whitespace is preserved
+    ('  claude-memory   foo ', '  "claude-memory"   foo '),
+])
+def test_auto_quote_hyphenated(query, expected):
+    assert _auto_quote_hyphenated(query) == expected
+
+
+@pytest.mark.parametrize('query, expected', [
+    # One word
+    ('OAuth', 'OAuth*'),
+    ('Reckitt*', 'Reckitt*'),
+    ('claude-memory', 'claude-memory*'),
+    # Operators are never wildcarded, in any case
+    ('AND', 'AND'),
+    ('or', 'or'),
+    ('NEAR', 'NEAR'),
+    ('OAuth OR JWT', 'OAuth* OR JWT*'),
+    ('OAuth NOT old', 'OAuth* NOT old*'),
+    # Column filters and phrases are left alone
+    ('title:x', 'title:x'),
+    ('title:foo bar', 'title:foo bar*'),
+    ('"OAuth refresh"', '"OAuth refresh"'),
+    ('"foo"bar', '"foo" bar*'),
+    ('"unclosed claude-memory', '"unclosed claude-memory*'),
+    # Whitespace runs collapse to single spaces
+    ('  OAuth   JWT  ', 'OAuth* JWT*'),
+    ('\tOAuth\n', 'OAuth*'),
+    ('   ', ''),
+    ('', ''),
+])
+def test_add_wildcard_suffix(query, expected):
+    assert _add_wildcard_suffix(query) == expected
+
+
+def _source(*turns, title='Session title'):
+    built = [{'role': role, 'text': text} for role, text in turns]
+    return SimpleNamespace(summary_text=None, title=title, _build_turns=lambda: built)
+
+
+# An empty <summary> tag in an early turn doesn't hide a real one later on
+def test_basic_summary_skips_empty_summary_tag():
+    source = _source(
+        ('human', COMPACTION_PREFIX + ' <summary></summary>'),
+        ('assistant', 'Working on it'),
+        ('human', 'Earlier: <summary>  Fixed the scan batching  </summary>'),
+    )
+    assert _create_basic_summary(source) == 'Fixed the scan batching'
+
+
+# Normal conversations use the title plus the first three user messages
+def test_basic_summary_uses_title_and_first_messages():
+    source = _source(
+        ('human', 'one'), ('assistant', 'ok'), ('human', ''),
+        ('human', 'two'), ('human', 'three'), ('human', 'four'),
+    )
+    assert _create_basic_summary(source) == 'Session title\n\none\n\ntwo\n\nthree'
+
+
+# _missing_paths agrees with Path.exists(): broken symlinks are missing,
+# live symlinks and plain files are present, gone directories are missing
+def test_missing_paths_matches_exists(tmp_path):
+    (tmp_path / 'note.md').write_text('x')
+    (tmp_path / 'live.md').symlink_to(tmp_path / 'note.md')
+    (tmp_path / 'broken.md').symlink_to(tmp_path / 'gone.md')
+    sources = [{'path': str(tmp_path / name)} for name in
+               ('note.md', 'live.md', 'broken.md', 'gone.md', 'nodir/x.md')]
+    sources.append({'path': None})
+
+    missing = [s['path'] for s in _missing_paths(sources)]
+
+    assert missing == [str(tmp_path / name) for name in ('broken.md', 'gone.md', 'nodir/x.md')]
+    assert missing == [s['path'] for s in sources if s['path'] and not Path(s['path']).exists()]
+
+
+# A name missing from the listing is still checked directly, so a stored
+# path differing only in case isn't reported missing on case-insensitive filesystems
+def test_missing_paths_case_insensitive_fs(tmp_path, monkeypatch):
+    (tmp_path / 'Note.md').write_text('x')
+    real_exists = Path.exists
+
+    def case_insensitive_exists(self):
+        if self.parent == tmp_path:
+            return self.name.lower() in {p.name.lower() for p in tmp_path.iterdir()}
+        return real_exists(self)
+
+    monkeypatch.setattr(Path, 'exists', case_insensitive_exists)
+    sources = [{'path': str(tmp_path / 'note.md')}, {'path': str(tmp_path / 'other.md')}]
+
+    assert _missing_paths(sources) == [sources[1]]
@@ -1,9 +1,16 @@
 """Tests for the scan CLI command."""
 
+import os
+import threading
+
 import pytest
 from click.testing import CliRunner
 
+from garde.adapters.handoffs import HandoffSource
+from garde.adapters.local_md import LocalMdSource
 from garde.cli import main
+from garde.cli._helpers import _flatten_extraction_for_fts
+from garde.database import Database
 
 
 class TestScanSourceFilter:
@@ -35,3 +42,150 @@ class TestScanSourceFilter:
 
         assert result.exit_code != 0
         assert 'Invalid value' in result.output or 'invalid' in result.output.lower()
+
+
+class TestScanLazyReads:
+    """Tests for how scan reads local markdown files."""
+
+    # Changed files are read on the parse pool; unchanged ones aren't read at all
+    def test_reads_only_changed_files_off_main_thread(self, tmp_path, monkeypatch):
+        notes = tmp_path / 'notes'
+        notes.mkdir()
+        for name in ('a', 'b', 'c'):
+            (notes / f'{name}.md').write_text(f'# Note {name}\n\nBody {name}\n')
+
+        db_path = tmp_path / 'test.db'
+        monkeypatch.setattr('garde.cli.scan.get_database', lambda: Database(db_path))
+        monkeypatch.setattr('garde.cli.load_config',
+                            lambda: {'sources': {'local_md': {'notes': str(notes)}}})
+
+        reads = []
+        original = LocalMdSource.load
+
+        def recording_load(self):
+            if self._content is None:
+                reads.append((self.path.name, threading.current_thread().name))
+            return original(self)
+
+        monkeypatch.setattr(LocalMdSource, 'load', recording_load)
+
+        runner = CliRunner()
+        result = runner.invoke(main, ['scan', '--source', 'local_md'])
+        assert result.exit_code == 0, result.output
+        assert '3 new' in result.output
+
+        reads.clear()
+        stat = (notes / 'b.md').stat()
+        os.utime(notes / 'b.md', (stat.st_atime, stat.st_mtime + 10))
+        result = runner.invoke(main, ['scan', '--source', 'local_md'])
+
+        assert result.exit_code == 0, result.output
+        assert '0 new, 1 updated' in result.output
+        assert {name for name, _ in reads} == {'b.md'}
+        assert reads[0][1] != threading.main_thread().name
+
+    # A file that can't be read is reported on stderr and the rest are stored
+    def test_unreadable_file_reported_on_stderr(self, tmp_path, monkeypatch):
+        notes = tmp_path / 'notes'
+        notes.mkdir()
+        for name in ('a', 'b'):
+            (notes / f'{name}.md').write_text(f'# Note {name}\n')
+
+        db_path = tmp_path / 'test.db'
+        monkeypatch.setattr('garde.cli.scan.get_database', lambda: Database(db_path))
+        monkeypatch.setattr('garde.cli.load_config',
+                            lambda: {'sources': {'local_md': {'notes': str(notes)}}})
+
+        original = LocalMdSource.load
+
+        def failing_load(self):
+            if self.path.name == 'b.md':
+                raise PermissionError(13, 'Permission denied', str(self.path))
+            return original(self)
+
+        monkeypatch.setattr(LocalMdSource, 'load', failing_load)
+
+        result = CliRunner().invoke(main, ['scan', '--source', 'local_md'])
+
+        assert result.exit_code == 0, result.output
+        assert 'Failed to read local_md:b.md' in result.stderr
+        assert 'Failed to read' not in result.stdout
+        assert 'Indexed: 1 new' in result.stdout
+        with Database(db_path) as db:
+            assert set(db.get_existing_hashes('local_md')) == {'local_md:a.md'}
+
+
+class TestScanBatchedWrites:
+    """Tests for scan's queued source and summary writes."""
+
+    @pytest.fixture
+    def scan_db(self, tmp_path, monkeypatch):
+        db_path = tmp_path / 'test.db'
+        monkeypatch.setattr('garde.cli.scan.get_database', lambda: Database(db_path))
+
+        # Scan must go through the batch upserts, not the single-row ones
+        def single_row(self, **kwargs):
+            raise AssertionError('scan wrote a single row')
+
+        monkeypatch.setattr(Database, 'upsert_source', single_row)
+        monkeypatch.setattr(Database, 'upsert_summary', single_row)
+        return db_path
+
+    # Every row lands, and summaries pick up titles from the sources flushed before them
+    def test_rows_written_in_batches(self, tmp_path, scan_db, monkeypatch):
+        notes = tmp_path / 'notes'
+        notes.mkdir()
+        for i in range(5):
+            (notes / f'n{i}.md').write_text(f'# Note {i}\n\nBody {i}\n')
+        monkeypatch.setattr('garde.cli.load_config',
+                            lambda: {'sources': {'local_md': {'notes': str(notes)}}})
+        batches = []
+        original = Database.upsert_sources_batch
+
+        def recording_batch(self, rows):
+            batches.append(len(rows))
+            return original(self, rows)
+
+        monkeypatch.setattr(Database, 'upsert_sources_batch', recording_batch)
+        monkeypatch.setattr('garde.cli.scan.ROW_BATCH_SIZE', 2)
+
+        result = CliRunner().invoke(main, ['scan', '--source', 'local_md'])
+
+        assert result.exit_code == 0, result.output
+        assert 'Indexed: 5 new' in result.output
+        assert batches == [2, 2, 1]
+        with Database(scan_db) as db:
+            rows = db.connect().execute(
+                "SELECT source_id, title, summary_text FROM summaries ORDER BY source_id"
+            ).fetchall()
+            status = {r[0] for r in db.connect().execute(
+                "SELECT status FROM sources WHERE source_type = 'local_md'")}
+        assert [tuple(r) for r in rows] == [
+            (f'local_md:n{i}.md', f'Note {i}', f'# Note {i}\n\nBody {i}\n') for i in range(5)
+        ]
+        assert status == {'processed'}
+
+    # A handoff's section extraction still ends up as its searchable summary
+    def test_handoff_extraction_summary_kept(self, tmp_path, scan_db, monkeypatch):
+        handoff_dir = tmp_path / 'handoffs' / '-Users-jane-Repos-test-project'
+        handoff_dir.mkdir(parents=True)
+        handoff_file = handoff_dir / 'test-project-2025-12-29-1234.md'
+        handoff_file.write_text(
+            "# Handoff — 2025-12-29 (momentum)\n\n## Done\n- Fixed the bug\n\n"
+            "## Learned\nSomething interesting about the codebase.\n"
+        )
+        monkeypatch.setattr('garde.cli.load_config', lambda: {'sources': {'handoffs': {
+            'path': str(tmp_path / 'handoffs'),
+            'bon_handoff_dirs': [str(tmp_path / 'no-bon')],
+        }}})
+
+        result = CliRunner().invoke(main, ['scan', '--source', 'handoffs'])
+
+        assert result.exit_code == 0, result.output
+        handoff = HandoffSource.from_file(handoff_file)
+        expected = (_flatten_extraction_for_fts(handoff.to_extraction()), handoff.full_text())
+        with Database(scan_db) as db:
+            row = db.connect().execute("SELECT summary_text, raw_text FROM summaries").fetchone()
+            extraction = db.get_extraction('handoff:test-project-2025-12-29-1234')
+        assert tuple(row) == expected
+        assert extraction['model_used'] == 'handoff-section-parse'
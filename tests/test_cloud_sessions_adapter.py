@@ -0,0 +1,64 @@
+"""Tests for the cloud sessions adapter's text-only path."""
+
+import json
+
+import pytest
+
+from garde.adapters.cloud_sessions import CloudSessionSource
+
+
+def _entry(entry_type, content, **extra):
+    return {
+        'type': entry_type,
+        'timestamp': '2025-12-28T10:00:00Z',
+        'message': {'role': entry_type, 'content': content},
+        **extra,
+    }
+
+
+@pytest.fixture
+def session_file(tmp_path):
+    """Cloud session exercising from_data's message filtering."""
+    loglines = [
+        {'type': 'summary', 'summary': 'Session summary'},
+        {'type': 'system', 'content': 'not a message'},
+        # Meta entries before the first real user message are dropped
+        _entry('user', 'Caveat: meta before first message', isMeta=True),
+        # A compaction prompt doesn't count as the first user message
+        _entry('user', 'Context: This summary will be shown in a list. User: hi'),
+        _entry('user', 'Another meta, still dropped', isMeta=True),
+        _entry('user', 'Run the tests'),
+        _entry('assistant', [
+            {'type': 'thinking', 'thinking': 'hmm'},
+            {'type': 'text', 'text': 'Running them'},
+            {'type': 'tool_use', 'name': 'Bash', 'input': {'command': 'pytest'}},
+            {'type': 'text', 'text': 'now.'},
+        ]),
+        _entry('user', [{'type': 'tool_result', 'content': 'ok'}]),
+        _entry('assistant', ''),
+        # Meta entries after the first user message are kept
+        _entry('user', 'Meta after first message', isMeta=True),
+        _entry('assistant', 'All green.'),
+    ]
+    path = tmp_path / 'session_01test.json'
+    path.write_text(json.dumps({'loglines': loglines}))
+    return path
+
+
+# text_only must stay in step with from_file(...).full_text()
+def test_text_only_matches_full_text(session_file):
+    full = CloudSessionSource.from_file(session_file).full_text()
+    assert CloudSessionSource.text_only(session_file) == full
+    assert 'meta before first' not in full
+    assert 'Meta after first message' in full
+    assert 'Running them\nnow.' in full
+
+
+# max_chars returns the same prefix, whether the cap lands inside a
+# message, on a separator or past the end
+def test_text_only_max_chars(session_file):
+    full = CloudSessionSource.from_file(session_file).full_text()
+    first_break = full.index('\n\n')
+    for n in (0, 1, first_break - 1, first_break, first_break + 1,
+              first_break + 2, first_break + 3, len(full) - 1, len(full), len(full) + 50):
+        assert CloudSessionSource.text_only(session_file, max_chars=n) == full[:n], n
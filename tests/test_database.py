@@ -225,3 +225,133 @@ def test_fts_title_from_sources(temp_db):
     # Should also find via summary text
     results = temp_db.search('deploy services')
     assert len(results) == 1
+
+
+def test_batch_defers_commits(temp_db):
+    """Writes inside batch() commit at batch boundaries and on exit."""
+    with temp_db.batch(every=2):
+        temp_db.upsert_source(source_id='test:1', source_type='test', title='One')
+        assert temp_db.connect().in_transaction
+        temp_db.upsert_source(source_id='test:2', source_type='test', title='Two')
+        assert not temp_db.connect().in_transaction
+        temp_db.upsert_source(source_id='test:3', source_type='test', title='Three')
+
+    assert not temp_db.connect().in_transaction
+    assert temp_db.source_exists('test:3')
+
+    # Outside batch() every write commits immediately again
+    temp_db.upsert_source(source_id='test:4', source_type='test', title='Four')
+    assert not temp_db.connect().in_transaction
+
+
+def test_get_existing_hashes(temp_db):
+    """Existing hashes are keyed by id and filtered by source type."""
+    temp_db.upsert_source(source_id='local_md:a.md', source_type='local_md', title='A', content_hash='1.0')
+    temp_db.upsert_source(source_id='local_md:b.md', source_type='local_md', title='B')
+    temp_db.upsert_source(source_id='knowledge:c.md', source_type='knowledge', title='C', content_hash='2.0')
+
+    assert temp_db.get_existing_hashes('local_md') == {'local_md:a.md': '1.0', 'local_md:b.md': None}
+    assert temp_db.get_existing_hashes('amp') == {}
+
+
+def test_upsert_batches_match_single_rows(temp_db):
+    """Batch upserts store the same rows as the single-row methods."""
+    temp_db.upsert_sources_batch([
+        {'source_id': 'test:1', 'source_type': 'test', 'title': 'One', 'metadata': {'k': 1}},
+        {'source_id': 'test:2', 'source_type': 'test', 'title': 'Two'},
+    ])
+    temp_db.upsert_summaries_batch([
+        {'source_id': 'test:1', 'summary_text': 'first summary', 'raw_text': 'x' * 100_001},
+        {'source_id': 'test:2', 'summary_text': 'second', 'title': 'Override'},
+    ])
+
+    assert temp_db.get_source('test:1')['title'] == 'One'
+    rows = {
+        row['source_id']: row for row in temp_db.connect().execute(
+            "SELECT source_id, title, word_count, length(raw_text) AS raw_len FROM summaries"
+        )
+    }
+    assert rows['test:1']['title'] == 'One'
+    assert rows['test:1']['word_count'] == 2
+    assert rows['test:1']['raw_len'] == 100_000
+    assert rows['test:2']['title'] == 'Override'
+
+
+def test_sync_fts_keeps_document_body_searchable(temp_db, monkeypatch):
+    """sync-fts replacing summary_text with the extraction digest keeps raw_text."""
+    from click.testing import CliRunner
+    from garde.cli import main
+    from garde.glossary import Glossary
+
+    body = 'quarterly planning notes with the zeppelin budget'
+    temp_db.upsert_source(source_id='local_md:a.md', source_type='local_md', title='A')
+    # Scan stores the document as both summary and raw text
+    temp_db.upsert_summary(source_id='local_md:a.md', summary_text=body, raw_text=body)
+    # backfill then extracts it (which also swaps in the extraction summary)
+    temp_db.upsert_extraction(source_id='local_md:a.md', summary='Planning digest',
+                              learnings=['Budget is tight'])
+
+    monkeypatch.setattr('garde.cli.fts.get_database', lambda: temp_db)
+    monkeypatch.setattr('garde.cli.load_config', lambda: {})
+    monkeypatch.setattr('garde.cli.load_glossary', lambda: Glossary({'entities': {}}))
+    result = CliRunner().invoke(main, ['sync-fts'])
+    assert 'Updated 1 FTS entries' in result.output
+
+    row = temp_db.connect().execute(
+        "SELECT summary_text, raw_text FROM summaries WHERE source_id = 'local_md:a.md'"
+    ).fetchone()
+    assert tuple(row) == ('Planning digest\nLearning: Budget is tight', body)
+    assert [r.source_id for r in temp_db.search('zeppelin')] == ['local_md:a.md']
+
+
+def test_mark_processed_batch(temp_db):
+    """Batch marking updates only the listed sources."""
+    for i in range(3):
+        temp_db.upsert_source(source_id=f'test:{i}', source_type='test', title=str(i))
+
+    temp_db.mark_processed_batch(['test:0', 'test:2'])
+    temp_db.mark_processed_batch([])
+
+    statuses = dict(temp_db.connect().execute("SELECT id, status FROM sources").fetchall())
+    assert statuses == {'test:0': 'processed', 'test:1': 'pending', 'test:2': 'processed'}
+
+
+def test_add_file_mentions_bulk(temp_db):
+    """Bulk file mentions span sources, skip duplicates and count inserts."""
+    for i in range(2):
+        temp_db.upsert_source(source_id=f'test:{i}', source_type='test', title=str(i))
+    temp_db.add_file_mentions_batch('test:0', ['/a.py'])
+
+    added = temp_db.add_file_mentions_bulk([
+        ('test:0', '/a.py'), ('test:0', '/b.py'), ('test:1', '/a.py'),
+    ])
+
+    assert added == 2
+    rows = temp_db.connect().execute(
+        "SELECT source_id, file_path FROM file_mentions ORDER BY 1, 2"
+    ).fetchall()
+    assert [tuple(r) for r in rows] == [('test:0', '/a.py'), ('test:0', '/b.py'), ('test:1', '/a.py')]
+    assert temp_db.add_file_mentions_bulk([]) == 0
+
+
+def test_get_extractions_batch(temp_db):
+    """Batch extraction lookup matches get_extraction and omits missing ids."""
+    for i in range(2):
+        temp_db.upsert_source(source_id=f'test:{i}', source_type='test', title=str(i))
+    temp_db.upsert_extraction(source_id='test:0', summary='Did a thing', builds=[{'what': 'x'}])
+
+    batch = temp_db.get_extractions(['test:0', 'test:1', 'test:missing'])
+    assert batch == {'test:0': temp_db.get_extraction('test:0')}
+    assert batch['test:0']['builds'] == [{'what': 'x'}]
+    assert temp_db.get_extractions([]) == {}
+
+
+def test_configure_for_writes_scopes_durability(temp_db):
+    """Only bulk write sessions relax synchronous; plain connections keep the default."""
+    conn = temp_db.connect()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+
+    temp_db.configure_for_writes()
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
@@ -0,0 +1,41 @@
+"""Tests for the shared discovery helpers."""
+
+import json
+import threading
+
+from garde.adapters._discovery import parse_parallel
+from garde.adapters.claude_ai import discover_claude_ai
+
+
+# Results come back in input order, errors alongside, all parsed on the shared pool
+def test_parse_parallel_shares_one_pool():
+    def parse(n):
+        if n == 3:
+            raise ValueError('bad')
+        return n * 10, threading.current_thread().name
+
+    first = list(parse_parallel(parse, range(5)))
+    second = list(parse_parallel(parse, range(5)))
+
+    assert [item for item, _, _ in first] == list(range(5))
+    assert [result[0] for _, result, error in first if error is None] == [0, 10, 20, 40]
+    assert isinstance(first[3][2], ValueError)
+    threads = {result[1] for _, result, error in first + second if error is None}
+    assert all(name.startswith('garde-parse') for name in threads)
+
+
+# A file that fails to parse is reported on stderr, not mixed into stdout
+def test_discover_reports_parse_errors_on_stderr(tmp_path, capsys):
+    (tmp_path / 'good.json').write_text(json.dumps({
+        'uuid': 'abc', 'name': 'Good', 'chat_messages': [],
+        'created_at': '2025-12-28T10:00:00', 'updated_at': '2025-12-28T11:00:00',
+    }))
+    (tmp_path / 'bad.json').write_text('{not json')
+
+    config = {'sources': {'claude_ai': {'path': str(tmp_path)}}}
+    sources = list(discover_claude_ai(config))
+
+    assert [source.name for source in sources] == ['Good']
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert 'Failed to parse' in captured.err and 'bad.json' in captured.err
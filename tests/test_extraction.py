@@ -47,6 +47,7 @@ def test_extraction_matches_known_entities(mock_glossary, mock_db):
     assert result.entities_found == 2
     assert result.matched == 2
     assert result.pending == 0
+    assert all(e['matched'] for e in result.entities)
 
     # Verify entities were stored in database
     stored = mock_db.get_entities_for_source('test:123')
@@ -73,6 +74,7 @@ def test_extraction_queues_unknown_entities(mock_glossary, mock_db):
     assert result.entities_found == 1
     assert result.matched == 0
     assert result.pending == 1
+    assert result.entities[0]['matched'] is False
 
     # Verify entity is in pending queue
     pending = mock_db.get_pending_entities()
@@ -24,6 +24,22 @@ Some content here.
         source = LocalMdSource.from_file(md_file, tmp_path)
         assert source.title == "Meeting with Stefan"
 
+    # When H1 follows frontmatter and blank lines, it should still be found
+    def test_title_from_h1_after_frontmatter(self, tmp_path):
+        content = """---
+tags: [meeting]
+---
+
+# Planning sync
+
+Body.
+"""
+        md_file = tmp_path / "test.md"
+        md_file.write_text(content)
+
+        source = LocalMdSource.from_file(md_file, tmp_path)
+        assert source.title == "Planning sync"
+
     # When file has no H1 but has timestamp prefix in filename, should strip it
     def test_title_strips_timestamp_prefix(self, tmp_path):
         content = "No H1 here, just content."
@@ -221,3 +237,19 @@ class TestDiscoverLocalMd:
         sources = list(discover_local_md(config))
         # Silent skip for missing paths (cross-platform compatibility)
         assert len(sources) == 0
+
+
+class TestLazyContent:
+    """Tests for deferred file reads."""
+
+    # When built from a stat, the file should not be read until content is needed
+    def test_content_read_on_first_access(self, tmp_path):
+        md_file = tmp_path / "notes.md"
+        md_file.write_text("# Old title")
+
+        source = LocalMdSource.from_file(md_file, tmp_path)
+        md_file.write_text("# New title")
+
+        assert source.source_id == "local_md:notes.md"
+        assert source.title == "New title"
+        assert source.full_text() == "# New title"